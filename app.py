@@ -1,16 +1,40 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, Response, session, send_from_directory, abort
+from flask import Flask, render_template, request, redirect, url_for, flash, Response, session, send_from_directory, abort, stream_with_context, stream_template, g, jsonify, make_response
 from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime, timedelta, date
+from markupsafe import escape
+from datetime import datetime, timedelta, date, timezone
 import csv
 import io
+import tempfile
+import sqlite3
+import shutil
+import atexit
+import queue
+import threading
+import time
 from werkzeug.security import generate_password_hash, check_password_hash
 from werkzeug.utils import secure_filename
 from functools import wraps
-from sqlalchemy import text
+from contextlib import contextmanager
+from sqlalchemy import text, bindparam, literal_column, event
 from sqlalchemy import desc
+from sqlalchemy import func, case, update, or_
+from sqlalchemy.orm import make_transient_to_detached, load_only
+from sqlalchemy.engine import Engine
+from collections import OrderedDict
+from itertools import islice
+from types import SimpleNamespace
 from pathlib import Path
+from urllib.parse import urlsplit, parse_qsl
 import os
+import sys
 import calendar
+import bisect
+import gzip
+import zlib
+import zipfile
+import hashlib
+import json
+import click
 
 app = Flask(__name__)
 
@@ -36,8 +60,76 @@ app.config['MINISTRY_NAME'] = 'Ministry of Women Affairs, Community, Small & Med
 app.config['LOGO_STATIC_PATH'] = '/static/zim_logo.png'
 app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(minutes=5)
 app.config['UPLOAD_FOLDER'] = str((Path(app.instance_path) / 'uploads').resolve())
+app.config['AUDIT_LOG_ASYNC'] = (os.environ.get('AUDIT_LOG_ASYNC') or '1') != '0'
+app.config['AUDIT_LOG_QUEUE_SIZE'] = int(os.environ.get('AUDIT_LOG_QUEUE_SIZE') or 10000)
+app.config['AUDIT_LOG_BATCH_SIZE'] = int(os.environ.get('AUDIT_LOG_BATCH_SIZE') or 200)
+app.config['AUDIT_LOG_FLUSH_SECONDS'] = float(os.environ.get('AUDIT_LOG_FLUSH_SECONDS') or 2)
+app.config['AUDIT_ROLLUP_ACTIONS'] = {a.strip() for a in (os.environ.get('AUDIT_ROLLUP_ACTIONS') or 'view_dashboard,view_asset,view_reports,view_search').split(',') if a.strip()}
+app.config['AUDIT_ROLLUP_FLUSH_SECONDS'] = float(os.environ.get('AUDIT_ROLLUP_FLUSH_SECONDS') or 60)
+app.config['AUDIT_RETENTION_DAYS'] = int(os.environ.get('AUDIT_RETENTION_DAYS') or 365)
+app.config['AUDIT_ARCHIVE_FOLDER'] = os.environ.get('AUDIT_ARCHIVE_FOLDER') or str((Path(app.instance_path) / 'audit_archive').resolve())
+app.config['AUDIT_ARCHIVE_BATCH_SIZE'] = int(os.environ.get('AUDIT_ARCHIVE_BATCH_SIZE') or 5000)
+app.config['AUTOCOMPLETE_REFRESH_SECONDS'] = float(os.environ.get('AUTOCOMPLETE_REFRESH_SECONDS') or 300)
+app.config['USER_CACHE_SIZE'] = int(os.environ.get('USER_CACHE_SIZE') or 256)
+app.config['USER_CACHE_TTL_SECONDS'] = float(os.environ.get('USER_CACHE_TTL_SECONDS') or 60)
+app.config['REPORT_CACHE_SIZE'] = int(os.environ.get('REPORT_CACHE_SIZE') or 64)
+app.config['REPORT_CACHE_TTL_SECONDS'] = float(os.environ.get('REPORT_CACHE_TTL_SECONDS') or 300)
+app.config['REPORT_CACHE_MAX_ROWS'] = int(os.environ.get('REPORT_CACHE_MAX_ROWS') or 5000)
+app.config['SQLITE_JOURNAL_MODE'] = (os.environ.get('SQLITE_JOURNAL_MODE') or 'WAL').upper()
+app.config['SQLITE_SYNCHRONOUS'] = (os.environ.get('SQLITE_SYNCHRONOUS') or 'NORMAL').upper()
+app.config['SQLITE_CACHE_SIZE'] = int(os.environ.get('SQLITE_CACHE_SIZE') or -20000)
+app.config['SQLITE_MMAP_SIZE'] = int(os.environ.get('SQLITE_MMAP_SIZE') or 268435456)
+app.config['SQLITE_BUSY_TIMEOUT_MS'] = int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS') or 5000)
+app.config['DB_POOL_SIZE'] = int(os.environ.get('DB_POOL_SIZE') or 5)
+app.config['DB_MAX_OVERFLOW'] = int(os.environ.get('DB_MAX_OVERFLOW') or 10)
+app.config['DB_POOL_TIMEOUT'] = float(os.environ.get('DB_POOL_TIMEOUT') or 30)
+app.config['DB_POOL_RECYCLE'] = int(os.environ.get('DB_POOL_RECYCLE') or 1800)
+app.config['DB_POOL_PRE_PING'] = (os.environ.get('DB_POOL_PRE_PING') or '1') != '0'
+app.config['DB_STATEMENT_TIMEOUT_MS'] = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS') or 30000)
+app.config['BACKUP_FOLDER'] = os.environ.get('BACKUP_FOLDER') or str((Path(app.instance_path) / 'backups').resolve())
+app.config['BACKUP_INTERVAL_HOURS'] = float(os.environ.get('BACKUP_INTERVAL_HOURS') or 24)
+app.config['BACKUP_RETENTION_COUNT'] = int(os.environ.get('BACKUP_RETENTION_COUNT') or 30)
+
+SQLITE_JOURNAL_MODES = ['DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF']
+SQLITE_SYNCHRONOUS_LEVELS = ['OFF', 'NORMAL', 'FULL', 'EXTRA']
+
+def storage_engine_options(uri):
+    if uri.startswith('sqlite'):
+        return {
+            'pool_size': app.config['DB_POOL_SIZE'],
+            'max_overflow': app.config['DB_MAX_OVERFLOW'],
+            'pool_timeout': app.config['DB_POOL_TIMEOUT'],
+            'connect_args': {'timeout': app.config['SQLITE_BUSY_TIMEOUT_MS'] / 1000, 'check_same_thread': False},
+        }
+    options = {
+        'pool_size': app.config['DB_POOL_SIZE'],
+        'max_overflow': app.config['DB_MAX_OVERFLOW'],
+        'pool_timeout': app.config['DB_POOL_TIMEOUT'],
+        'pool_recycle': app.config['DB_POOL_RECYCLE'],
+        'pool_pre_ping': app.config['DB_POOL_PRE_PING'],
+    }
+    if uri.startswith('postgresql') and app.config['DB_STATEMENT_TIMEOUT_MS']:
+        options['connect_args'] = {'options': f"-c statement_timeout={app.config['DB_STATEMENT_TIMEOUT_MS']}"}
+    return options
+
+if ':memory:' not in app.config['SQLALCHEMY_DATABASE_URI'] and app.config['SQLALCHEMY_DATABASE_URI'] != 'sqlite://':
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = storage_engine_options(app.config['SQLALCHEMY_DATABASE_URI'])
 db = SQLAlchemy(app)
 
+@event.listens_for(Engine, 'connect')
+def apply_sqlite_pragmas(dbapi_connection, connection_record):
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    journal_mode = app.config['SQLITE_JOURNAL_MODE'] if app.config['SQLITE_JOURNAL_MODE'] in SQLITE_JOURNAL_MODES else 'WAL'
+    synchronous = app.config['SQLITE_SYNCHRONOUS'] if app.config['SQLITE_SYNCHRONOUS'] in SQLITE_SYNCHRONOUS_LEVELS else 'NORMAL'
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA busy_timeout = {int(app.config['SQLITE_BUSY_TIMEOUT_MS'])}")
+    cursor.execute(f'PRAGMA journal_mode = {journal_mode}')
+    cursor.execute(f'PRAGMA synchronous = {synchronous}')
+    cursor.execute(f"PRAGMA cache_size = {int(app.config['SQLITE_CACHE_SIZE'])}")
+    cursor.execute(f"PRAGMA mmap_size = {int(app.config['SQLITE_MMAP_SIZE'])}")
+    cursor.close()
+
 
 PROVINCE_DISTRICTS = {
     'Head Office': [],
@@ -60,6 +152,29 @@ ROUTINE_SERVICE_TYPES = ['Laptop', 'Desktop', 'All-in-One', 'Printer']
 ROUTINE_SERVICE_INTERVAL_MONTHS = 6
 ROUTINE_SERVICE_DUE_SOON_DAYS = 30
 
+DASHBOARD_PAGE_SIZE = 50
+EXPORT_BATCH_SIZE = 500
+API_PAGE_SIZE = 100
+API_MAX_PAGE_SIZE = 1000
+AUDIT_PAGE_SIZE = 100
+AUDIT_COUNT_CAP = 10000
+DASHBOARD_TABS = ['ict', 'general', 'archived']
+IMPORT_BATCH_SIZE = 500
+IMPORT_COLUMNS = ['name', 'category', 'type', 'serial_number', 'purchase_date', 'acquisition_type', 'supplier', 'delivery_note', 'donor_name', 'status', 'assigned_to', 'province', 'district', 'general_comments']
+IMPORT_STATUSES = ['In Use', 'In Stock', 'Broken']
+BULK_EDIT_LIMIT = 1000
+BULK_EDIT_ACTIONS = ['status', 'reassign', 'service', 'inspect']
+BULK_EDIT_STATUSES = ['In Use', 'In Stock', 'Broken', 'Archived']
+XLSX_INTEGER_COLUMNS = ['ID', 'Asset ID', 'Days To Due']
+XLSX_DATE_COLUMNS = ['Purchase Date', 'Antivirus License', 'Office License', 'EOL Date', 'Inspection Date', 'Last Service Date', 'Next Service Due']
+XLSX_DATETIME_COLUMNS = ['Date / Time']
+PDF_COLUMNS = {
+    'all': [('ID', 1), ('Name', 3), ('Type', 2), ('Serial', 2.5), ('Status', 1.8), ('Assigned To', 2.5), ('Supplier', 2.3), ('Province', 2.2), ('District', 2.2), ('EOL Date', 1.8), ('EOL Status', 3), ('Inspected', 1.3)],
+    'routine_service_due': [('ID', 1), ('Name', 3), ('Type', 1.8), ('Serial', 2.5), ('Status', 1.6), ('Assigned To', 2.3), ('Supplier', 2.1), ('Province', 2), ('District', 2), ('Last Service Date', 2), ('Next Service Due', 2), ('Days To Due', 1.4), ('Service Status', 2)],
+    'furniture_general': [('ID', 1), ('Name', 3), ('Category', 1.8), ('Type', 1.8), ('Serial', 2.5), ('Purchase Date', 1.8), ('Status', 1.6), ('Assigned To', 2.3), ('Location', 3.5), ('Comments', 4)],
+    'movement': [('Date / Time', 2.8), ('Asset ID', 1.2), ('Name', 2.8), ('Serial', 2.2), ('Action', 1.5), ('Field', 1.7), ('Old Value', 2.5), ('New Value', 2.5), ('User', 1.8), ('Description', 5)],
+}
+
 
 def add_months(d, months):
     if not d:
@@ -73,16 +188,83 @@ def add_months(d, months):
 def subtract_months(d, months):
     return add_months(d, -months)
 
+
+EOL_YEARS = {
+    'Laptop': 3,
+    'Desktop': 5,
+    'All-in-One': 5,
+    'Cellphone': 2,
+    'Tablet': 2,
+}
+EOL_WARNING_DAYS = 240
+
+
+def compute_eol_date(asset_type, purchase_date):
+    years = EOL_YEARS.get(asset_type)
+    if not purchase_date or not years:
+        return None
+    return purchase_date + timedelta(days=years * 365)
+
+
+def compute_routine_service_due_date(asset_type, purchase_date, last_service_date):
+    if asset_type not in ROUTINE_SERVICE_TYPES:
+        return None
+    base = last_service_date or purchase_date
+    if not base:
+        return None
+    return add_months(base, ROUTINE_SERVICE_INTERVAL_MONTHS)
+
+
+def routine_service_due(asset_type, due_date):
+    if asset_type not in ROUTINE_SERVICE_TYPES or not due_date:
+        return None
+    return datetime.now().date() >= due_date
+
+
+def routine_service_due_soon(asset_type, due_date):
+    if asset_type not in ROUTINE_SERVICE_TYPES or not due_date:
+        return None
+    today = datetime.now().date()
+    if due_date <= today:
+        return False
+    return due_date <= (today + timedelta(days=ROUTINE_SERVICE_DUE_SOON_DAYS))
+
+
+def eol_passed(eol_date):
+    if not eol_date:
+        return None
+    return datetime.now().date() >= eol_date
+
+
+def eol_approaching(eol_date):
+    if not eol_date:
+        return None
+    # 8 months ~ 240 days
+    warning_threshold = eol_date - timedelta(days=EOL_WARNING_DAYS)
+    today = datetime.now().date()
+    return today >= warning_threshold and today < eol_date
+
+
+def eol_status_label(eol_date):
+    if not eol_date:
+        return None
+    if eol_passed(eol_date):
+        return 'Past End-of-Life'
+    if eol_approaching(eol_date):
+        remaining_days = (eol_date - datetime.now().date()).days
+        return f'Approaching EOL ({remaining_days} days left)'
+    return f'EOL on {eol_date}'
+
 class Asset(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
-    type = db.Column(db.String(50), nullable=False)
+    type = db.Column(db.String(50), nullable=False, index=True)
     serial_number = db.Column(db.String(100), unique=True, nullable=False)
-    purchase_date = db.Column(db.Date, nullable=True)
-    assigned_to = db.Column(db.String(100), nullable=True)
-    supplier = db.Column(db.String(120), nullable=True)
+    purchase_date = db.Column(db.Date, nullable=True, index=True)
+    assigned_to = db.Column(db.String(100), nullable=True, index=True)
+    supplier = db.Column(db.String(120), nullable=True, index=True)
     status = db.Column(db.String(50), default='In Stock')
-    acquisition_type = db.Column(db.String(20), nullable=True)
+    acquisition_type = db.Column(db.String(20), nullable=True, index=True)
     donor_name = db.Column(db.String(120), nullable=True)
     capture_date = db.Column(db.Date, nullable=True)
     general_comments = db.Column(db.Text, nullable=True)
@@ -96,40 +278,29 @@ class Asset(db.Model):
     os_name = db.Column(db.String(100), nullable=True)
     province = db.Column(db.String(100), nullable=True)
     district = db.Column(db.String(100), nullable=True)
-    inspected_by_ict = db.Column(db.Boolean, default=False)
+    inspected_by_ict = db.Column(db.Boolean, default=False, index=True)
     inspection_date = db.Column(db.Date, nullable=True)
     created_by_user_id = db.Column(db.Integer, nullable=True)
     last_service_date = db.Column(db.Date, nullable=True)
+    eol_date = db.Column(db.Date, nullable=True, index=True)
+    routine_service_due_date = db.Column(db.Date, nullable=True, index=True)
 
-    @property
-    def routine_service_due_date(self):
-        if self.type not in ROUTINE_SERVICE_TYPES:
-            return None
-        base = self.last_service_date or self.purchase_date
-        if not base:
-            return None
-        return add_months(base, ROUTINE_SERVICE_INTERVAL_MONTHS)
+    __table_args__ = (
+        db.Index('ix_asset_province_district', 'province', 'district'),
+        db.Index('ix_asset_status_category', 'status', 'category'),
+    )
+
+    def refresh_lifecycle_dates(self):
+        self.eol_date = compute_eol_date(self.type, self.purchase_date)
+        self.routine_service_due_date = compute_routine_service_due_date(self.type, self.purchase_date, self.last_service_date)
 
     @property
     def is_routine_service_due(self):
-        if self.type not in ROUTINE_SERVICE_TYPES:
-            return None
-        due_date = self.routine_service_due_date
-        if not due_date:
-            return None
-        return datetime.now().date() >= due_date
+        return routine_service_due(self.type, self.routine_service_due_date)
 
     @property
     def is_routine_service_due_soon(self):
-        if self.type not in ROUTINE_SERVICE_TYPES:
-            return None
-        due_date = self.routine_service_due_date
-        if not due_date:
-            return None
-        today = datetime.now().date()
-        if due_date <= today:
-            return False
-        return due_date <= (today + timedelta(days=ROUTINE_SERVICE_DUE_SOON_DAYS))
+        return routine_service_due_soon(self.type, self.routine_service_due_date)
 
     @property
     def is_antivirus_expired(self):
@@ -149,46 +320,19 @@ class Asset(db.Model):
 
     @property
     def eol_years(self):
-        mapping = {
-            'Laptop': 3,
-            'Desktop': 5,
-            'All-in-One': 5,
-            'Cellphone': 2,
-            'Tablet': 2,
-        }
-        return mapping.get(self.type)
-
-    @property
-    def eol_date(self):
-        if not self.purchase_date or not self.eol_years:
-            return None
-        return self.purchase_date + timedelta(days=self.eol_years * 365)
+        return EOL_YEARS.get(self.type)
 
     @property
     def is_eol_passed(self):
-        if not self.eol_date:
-            return None
-        return datetime.now().date() >= self.eol_date
+        return eol_passed(self.eol_date)
 
     @property
     def is_eol_approaching(self):
-        if not self.eol_date:
-            return None
-        # 8 months ~ 240 days
-        warning_threshold = self.eol_date - timedelta(days=240)
-        today = datetime.now().date()
-        return today >= warning_threshold and today < self.eol_date
+        return eol_approaching(self.eol_date)
 
     @property
     def eol_status(self):
-        if not self.eol_date:
-            return None
-        if self.is_eol_passed:
-            return 'Past End-of-Life'
-        if self.is_eol_approaching:
-            remaining_days = (self.eol_date - datetime.now().date()).days
-            return f'Approaching EOL ({remaining_days} days left)'
-        return f'EOL on {self.eol_date}'
+        return eol_status_label(self.eol_date)
 
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -226,25 +370,57 @@ def bootstrap_it_admin():
     db.session.commit()
 
 
+ASSET_SCHEMA_COLUMNS = [
+    ('last_service_date', 'DATE'),
+    ('eol_date', 'DATE'),
+    ('routine_service_due_date', 'DATE'),
+]
+
+
 def ensure_asset_schema():
+    added = []
     try:
         engine_name = db.engine.name
         if engine_name == 'sqlite':
             cols = [r[1] for r in db.session.execute(text('PRAGMA table_info(asset)')).fetchall()]
-            if 'last_service_date' not in cols:
-                db.session.execute(text('ALTER TABLE asset ADD COLUMN last_service_date DATE'))
-                db.session.commit()
         else:
-            exists = db.session.execute(
-                text(
-                    "SELECT 1 FROM information_schema.columns WHERE table_name='asset' AND column_name='last_service_date'"
-                )
-            ).first()
-            if not exists:
-                db.session.execute(text('ALTER TABLE asset ADD COLUMN last_service_date DATE'))
-                db.session.commit()
+            cols = [
+                r[0] for r in db.session.execute(
+                    text("SELECT column_name FROM information_schema.columns WHERE table_name='asset'")
+                ).fetchall()
+            ]
+        for name, ddl_type in ASSET_SCHEMA_COLUMNS:
+            if name not in cols:
+                db.session.execute(text(f'ALTER TABLE asset ADD COLUMN {name} {ddl_type}'))
+                added.append(name)
+        db.session.commit()
     except Exception:
         db.session.rollback()
+    return added
+
+
+def backfill_lifecycle_dates():
+    pending = []
+    rows = db.session.query(
+        Asset.id, Asset.type, Asset.purchase_date, Asset.last_service_date, Asset.eol_date, Asset.routine_service_due_date
+    ).order_by(Asset.id).yield_per(EXPORT_BATCH_SIZE)
+    for asset_id, asset_type, purchase_date, last_service_date, eol_date, due_date in rows:
+        new_eol = compute_eol_date(asset_type, purchase_date)
+        new_due = compute_routine_service_due_date(asset_type, purchase_date, last_service_date)
+        if (new_eol, new_due) != (eol_date, due_date):
+            pending.append({'id': asset_id, 'eol_date': new_eol, 'routine_service_due_date': new_due})
+    for i in range(0, len(pending), EXPORT_BATCH_SIZE):
+        db.session.execute(update(Asset), pending[i:i + EXPORT_BATCH_SIZE])
+    if pending:
+        bump_data_version()
+    db.session.commit()
+    return len(pending)
+
+
+@app.cli.command('backfill-lifecycle')
+def backfill_lifecycle_command():
+    updated = backfill_lifecycle_dates()
+    print(f"Lifecycle dates recomputed: {updated} assets updated")
 
 
 def login_required(f):
@@ -255,11 +431,65 @@ def login_required(f):
         return f(*args, **kwargs)
     return wrapper
 
+class UserCache:
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, user_id):
+        with self.lock:
+            entry = self.entries.get(user_id)
+            if not entry:
+                return None
+            user, expires_at = entry
+            if expires_at < time.monotonic():
+                del self.entries[user_id]
+                return None
+            self.entries.move_to_end(user_id)
+            return user
+
+    def put(self, user):
+        snapshot = User(**{c.name: getattr(user, c.name) for c in User.__table__.columns})
+        make_transient_to_detached(snapshot)
+        with self.lock:
+            self.entries[user.id] = (snapshot, time.monotonic() + self.ttl)
+            self.entries.move_to_end(user.id)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, user_id):
+        with self.lock:
+            self.entries.pop(user_id, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+user_cache = UserCache(app.config['USER_CACHE_SIZE'], app.config['USER_CACHE_TTL_SECONDS'])
+
+def invalidate_user(user_id):
+    user_cache.invalidate(user_id)
+    g.pop('current_user', None)
+
 def current_user():
     uid = session.get('user_id')
     if not uid:
         return None
-    return User.query.get(uid)
+    u = g.get('current_user')
+    if u is not None and u.id == uid:
+        return u
+    cached = user_cache.get(uid)
+    if cached is not None:
+        u = db.session.merge(cached, load=False)
+    else:
+        u = db.session.get(User, uid)
+        if u is None:
+            return None
+        user_cache.put(u)
+    g.current_user = u
+    return u
 
 def is_it():
     u = current_user()
@@ -280,7 +510,7 @@ def has_asset_edit_rights():
     if u.role == 'IT':
         return True
     return u.role in ['Admin', 'AdminProvince', 'AdminDistrict']
-def filter_by_user_location(query):
+def filter_by_user_location(query, model=Asset):
     u = current_user()
     if not u:
         return query
@@ -288,13 +518,13 @@ def filter_by_user_location(query):
         return query
     if u.province == 'Head Office':
         return query
-    q = query.filter(Asset.province == u.province)
+    q = query.filter(model.province == u.province)
     if u.district:
         if u.role == 'AdminDistrict':
-            q = q.filter(Asset.district == u.district)
+            q = q.filter(model.district == u.district)
         else:
             if ',' not in (u.district or ''):
-                q = q.filter(Asset.district == u.district)
+                q = q.filter(model.district == u.district)
     return q
 
 @app.context_processor
@@ -308,13 +538,73 @@ def inject_user():
     }
 class AuditLog(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
     actor_user_id = db.Column(db.Integer, nullable=True)
     action = db.Column(db.String(100), nullable=False)
     entity_type = db.Column(db.String(50), nullable=True)
     entity_id = db.Column(db.Integer, nullable=True)
     details = db.Column(db.Text, nullable=True)
 
+    __table_args__ = (
+        db.Index('ix_audit_log_action_timestamp', 'action', 'timestamp'),
+        db.Index('ix_audit_log_actor_timestamp', 'actor_user_id', 'timestamp'),
+        db.Index('ix_audit_log_entity_timestamp', 'entity_type', 'entity_id', 'timestamp'),
+    )
+
+class AuditCounter(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    hour = db.Column(db.DateTime, nullable=False)
+    actor_user_id = db.Column(db.Integer, nullable=False, default=0)
+    action = db.Column(db.String(100), nullable=False)
+    entity_type = db.Column(db.String(50), nullable=False, default='')
+    entity_id = db.Column(db.Integer, nullable=False, default=0)
+    subject = db.Column(db.String(255), nullable=False, default='')
+    count = db.Column(db.Integer, nullable=False, default=0)
+    last_seen = db.Column(db.DateTime, nullable=False)
+
+    __table_args__ = (
+        db.UniqueConstraint('hour', 'actor_user_id', 'action', 'entity_type', 'entity_id', 'subject', name='uq_audit_counter_key'),
+        db.Index('ix_audit_counter_actor_hour', 'actor_user_id', 'hour'),
+        db.Index('ix_audit_counter_entity_hour', 'entity_type', 'entity_id', 'hour'),
+    )
+
+AUDIT_COUNTER_KEY = ['hour', 'actor_user_id', 'action', 'entity_type', 'entity_id', 'subject']
+
+def ensure_audit_counter_schema():
+    # Counters created before the subject column have the old unique key, which SQLite
+    # cannot alter in place; rebuild the table and keep the existing counts
+    if 'subject' in {c['name'] for c in db.inspect(db.engine).get_columns('audit_counter')}:
+        return
+    table = AuditCounter.__table__
+    columns = [c for c in table.columns if c.name not in ('id', 'subject')]
+    rows = [dict(r._mapping) for r in db.session.execute(db.select(*columns))]
+    db.session.commit()
+    table.drop(db.engine)
+    table.create(db.engine)
+    for i in range(0, len(rows), 1000):
+        db.session.execute(table.insert(), [dict(r, subject='') for r in rows[i:i + 1000]])
+    db.session.commit()
+
+def bump_audit_counter(key, delta, last_seen):
+    table = AuditCounter.__table__
+    values = dict(zip(AUDIT_COUNTER_KEY, key))
+    engine_name = db.engine.name
+    if engine_name in ('sqlite', 'postgresql'):
+        if engine_name == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        stmt = insert(table).values(count=delta, last_seen=last_seen, **values).on_conflict_do_update(
+            index_elements=AUDIT_COUNTER_KEY,
+            set_={'count': table.c.count + delta, 'last_seen': last_seen},
+        )
+        db.session.execute(stmt)
+        return
+    match = [table.c[k] == v for k, v in values.items()]
+    result = db.session.execute(table.update().where(*match).values(count=table.c.count + delta, last_seen=last_seen))
+    if not result.rowcount:
+        db.session.execute(table.insert().values(count=delta, last_seen=last_seen, **values))
+
 class AssetComment(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     asset_id = db.Column(db.Integer, db.ForeignKey('asset.id'), nullable=False, index=True)
@@ -345,21 +635,619 @@ class AssetDocument(db.Model):
     original_filename = db.Column(db.String(255), nullable=False)
     stored_filename = db.Column(db.String(255), nullable=False)
 
-def log_action(action, entity_type=None, entity_id=None, details=None):
-    try:
-        entry = AuditLog(
-            actor_user_id=current_user().id if current_user() else None,
-            action=action,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            details=details
+class InventorySummary(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    province = db.Column(db.String(100), nullable=False, default='')
+    district = db.Column(db.String(100), nullable=False, default='')
+    category = db.Column(db.String(50), nullable=False, default='')
+    type = db.Column(db.String(50), nullable=False, default='')
+    status = db.Column(db.String(50), nullable=False, default='')
+    inspected_by_ict = db.Column(db.Boolean, nullable=False, default=False)
+    asset_count = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        db.UniqueConstraint('province', 'district', 'category', 'type', 'status', 'inspected_by_ict', name='uq_inventory_summary_key'),
+    )
+
+INVENTORY_SUMMARY_KEY = ['province', 'district', 'category', 'type', 'status', 'inspected_by_ict']
+
+def inventory_summary_key(asset):
+    return (
+        asset.province or '',
+        asset.district or '',
+        asset.category or '',
+        asset.type or '',
+        asset.status or '',
+        bool(asset.inspected_by_ict),
+    )
+
+def bump_inventory_summary(key, delta):
+    table = InventorySummary.__table__
+    values = dict(zip(INVENTORY_SUMMARY_KEY, key))
+    engine_name = db.engine.name
+    if engine_name in ('sqlite', 'postgresql'):
+        if engine_name == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        stmt = insert(table).values(asset_count=delta, **values).on_conflict_do_update(
+            index_elements=INVENTORY_SUMMARY_KEY,
+            set_={'asset_count': table.c.asset_count + delta},
         )
-        db.session.add(entry)
+        db.session.execute(stmt)
+        return
+    match = [table.c[k] == v for k, v in values.items()]
+    result = db.session.execute(table.update().where(*match).values(asset_count=table.c.asset_count + delta))
+    if not result.rowcount:
+        db.session.execute(table.insert().values(asset_count=delta, **values))
+
+def adjust_inventory_summary(old_key, new_key):
+    if old_key == new_key:
+        return
+    if old_key:
+        bump_inventory_summary(old_key, -1)
+    if new_key:
+        bump_inventory_summary(new_key, 1)
+
+def rebuild_inventory_summary():
+    rows = db.session.query(
+        func.coalesce(Asset.province, ''),
+        func.coalesce(Asset.district, ''),
+        func.coalesce(Asset.category, ''),
+        func.coalesce(Asset.type, ''),
+        func.coalesce(Asset.status, ''),
+        func.coalesce(Asset.inspected_by_ict, False),
+        func.count(Asset.id),
+    ).group_by(
+        func.coalesce(Asset.province, ''),
+        func.coalesce(Asset.district, ''),
+        func.coalesce(Asset.category, ''),
+        func.coalesce(Asset.type, ''),
+        func.coalesce(Asset.status, ''),
+        func.coalesce(Asset.inspected_by_ict, False),
+    ).all()
+    db.session.execute(InventorySummary.__table__.delete())
+    if rows:
+        db.session.execute(
+            InventorySummary.__table__.insert(),
+            [dict(zip(INVENTORY_SUMMARY_KEY + ['asset_count'], list(r[:5]) + [bool(r[5]), r[6]])) for r in rows],
+        )
+    bump_data_version()
+    db.session.commit()
+    return len(rows)
+
+def ensure_inventory_summary():
+    try:
+        if InventorySummary.query.first() is None and Asset.query.first() is not None:
+            rebuild_inventory_summary()
+    except Exception:
+        db.session.rollback()
+
+@app.cli.command('rebuild-summary')
+def rebuild_summary_command():
+    groups = rebuild_inventory_summary()
+    print(f"Inventory summary rebuilt: {groups} groups")
+
+class DataVersion(db.Model):
+    scope = db.Column(db.String(100), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+def bump_data_version(provinces=None):
+    table = DataVersion.__table__
+    now = datetime.utcnow()
+    if provinces is None:
+        db.session.execute(table.update().where(table.c.scope != '').values(version=table.c.version + 1, updated_at=now))
+        scopes = ['']
+    else:
+        scopes = sorted({''} | {p or '' for p in provinces})
+    engine_name = db.engine.name
+    for scope in scopes:
+        if engine_name in ('sqlite', 'postgresql'):
+            if engine_name == 'sqlite':
+                from sqlalchemy.dialects.sqlite import insert
+            else:
+                from sqlalchemy.dialects.postgresql import insert
+            db.session.execute(insert(table).values(scope=scope, version=1, updated_at=now).on_conflict_do_update(
+                index_elements=['scope'],
+                set_={'version': table.c.version + 1, 'updated_at': now},
+            ))
+            continue
+        result = db.session.execute(table.update().where(table.c.scope == scope).values(version=table.c.version + 1, updated_at=now))
+        if not result.rowcount:
+            db.session.execute(table.insert().values(scope=scope, version=1, updated_at=now))
+    g.pop('data_version', None)
+
+def data_version():
+    if 'data_version' in g:
+        return g.data_version
+    scope = user_location_scope()
+    row = db.session.query(DataVersion.version, DataVersion.updated_at).filter(DataVersion.scope == ('' if scope is None else scope[0])).first()
+    g.data_version = (row.version, row.updated_at) if row else (0, None)
+    return g.data_version
+
+class ReportCache:
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if not entry:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = (value, time.monotonic() + self.ttl)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+report_cache = ReportCache(app.config['REPORT_CACHE_SIZE'], app.config['REPORT_CACHE_TTL_SECONDS'])
+
+REPORT_ASSET_COLUMNS = [
+    'id', 'name', 'category', 'type', 'serial_number', 'purchase_date', 'acquisition_type', 'status', 'assigned_to',
+    'supplier', 'donor_name', 'province', 'district', 'general_comments', 'os_name', 'antivirus_name',
+    'antivirus_license_date', 'office_name', 'office_license_date', 'inspected_by_ict', 'inspection_date',
+    'last_service_date', 'eol_date', 'routine_service_due_date',
+]
+
+class ReportAsset:
+    # Read-only view of a report row. The cache holds the plain rows, shared between
+    # threads; the date-dependent fields the report templates use are computed per request.
+    __slots__ = ('row',)
+
+    def __init__(self, row):
+        self.row = row
+
+    def __getattr__(self, name):
+        return getattr(self.row, name)
+
+    @property
+    def is_routine_service_due(self):
+        return routine_service_due(self.row.type, self.row.routine_service_due_date)
+
+    @property
+    def is_routine_service_due_soon(self):
+        return routine_service_due_soon(self.row.type, self.row.routine_service_due_date)
+
+    @property
+    def eol_status(self):
+        return eol_status_label(self.row.eol_date)
+
+REPORT_FILTER_ARGS = ['assigned_to', 'supplier', 'status', 'province', 'district', 'uninspected', 'start_date', 'end_date']
+
+def report_cache_key(kind, report_type):
+    filters = tuple((k, (request.args.get(k) or '').strip()) for k in REPORT_FILTER_ARGS)
+    return (kind, user_location_scope(), report_type, filters, data_version()[0], date.today())
+
+def data_version_validator():
+    if session.get('_flashes'):
+        return None
+    version, updated_at = data_version()
+    u = current_user()
+    raw = json.dumps([
+        request.path, u.id if u else None, u.role if u else None, user_location_scope(),
+        version, sorted(request.args.items(multi=True)), date.today().isoformat(),
+    ])
+    # updated_at is naive UTC; the day boundary is local midnight, converted to match
+    last_modified = datetime.combine(date.today(), datetime.min.time()).astimezone(timezone.utc).replace(tzinfo=None)
+    if updated_at and updated_at > last_modified:
+        last_modified = updated_at
+    return hashlib.sha1(raw.encode()).hexdigest(), last_modified
+
+def apply_validator(resp, validator, shared=False):
+    if validator is None:
+        return resp
+    etag, last_modified = validator
+    resp.set_etag(etag)
+    resp.last_modified = last_modified
+    if shared:
+        resp.headers['Cache-Control'] = 'no-cache'
+        resp.vary.add('Cookie')
+    else:
+        resp.headers['Cache-Control'] = 'private, no-cache'
+    return resp
+
+def not_modified_response(validator, shared=False):
+    if validator is None:
+        return None
+    resp = apply_validator(Response(), validator, shared).make_conditional(request)
+    return resp if resp.status_code == 304 else None
+
+ASSET_SEARCH_COLUMNS = ['name', 'serial_number', 'assigned_to', 'supplier', 'comments']
+ASSET_SEARCH_WEIGHTS = '10.0, 10.0, 4.0, 2.0, 1.0'
+ASSET_SEARCH_MIN_TERM = 3
+asset_search_state = {'backend': None}
+
+def ensure_asset_search():
+    engine_name = db.engine.name
+    backend = None
+    try:
+        if engine_name == 'sqlite':
+            exists = db.session.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'asset_search'")).first()
+            db.session.execute(text(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS asset_search USING fts5("
+                + ', '.join(ASSET_SEARCH_COLUMNS) + ", tokenize='trigram')"
+            ))
+            db.session.commit()
+            backend = 'fts5'
+            asset_search_state['backend'] = backend
+            if not exists:
+                reindex_asset_search(full=True)
+        elif engine_name == 'postgresql':
+            db.session.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+            db.session.execute(text('CREATE INDEX IF NOT EXISTS ix_asset_name_trgm ON asset USING gin (name gin_trgm_ops)'))
+            db.session.execute(text('CREATE INDEX IF NOT EXISTS ix_asset_serial_number_trgm ON asset USING gin (serial_number gin_trgm_ops)'))
+            db.session.execute(text(f'CREATE INDEX IF NOT EXISTS ix_asset_search_document_trgm ON asset USING gin (({asset_search_document_sql()}) gin_trgm_ops)'))
+            db.session.execute(text('CREATE INDEX IF NOT EXISTS ix_asset_comment_content_trgm ON asset_comment USING gin (content gin_trgm_ops)'))
+            db.session.commit()
+            backend = 'trgm'
+    except Exception:
+        db.session.rollback()
+        backend = None
+    asset_search_state['backend'] = backend
+    return backend
+
+def asset_search_document_sql(prefix=''):
+    return " || ' ' || ".join(f"coalesce({prefix}{c}, '')" for c in ['name', 'serial_number', 'assigned_to', 'supplier', 'general_comments'])
+
+def sync_asset_search(asset_ids):
+    if asset_search_state['backend'] != 'fts5':
+        return
+    asset_ids = sorted({i for i in asset_ids if i})
+    if not asset_ids:
+        return
+    db.session.flush()
+    ids = bindparam('ids', expanding=True)
+    for i in range(0, len(asset_ids), 500):
+        chunk = asset_ids[i:i + 500]
+        db.session.execute(text('DELETE FROM asset_search WHERE rowid IN :ids').bindparams(ids), {'ids': chunk})
+        db.session.execute(text(
+            "INSERT INTO asset_search (rowid, name, serial_number, assigned_to, supplier, comments) "
+            "SELECT a.id, coalesce(a.name, ''), coalesce(a.serial_number, ''), coalesce(a.assigned_to, ''), coalesce(a.supplier, ''), "
+            "coalesce(a.general_comments, '') || ' ' || coalesce((SELECT group_concat(c.content, ' ') FROM asset_comment c WHERE c.asset_id = a.id), '') "
+            "FROM asset a WHERE a.id IN :ids"
+        ).bindparams(ids), {'ids': chunk})
+
+def reindex_asset_search(full=False, batch_size=1000):
+    if asset_search_state['backend'] != 'fts5':
+        return 0
+    if full:
+        db.session.execute(text('DELETE FROM asset_search'))
+        pending = [r[0] for r in db.session.query(Asset.id).order_by(Asset.id)]
+    else:
+        pending = [r[0] for r in db.session.execute(text(
+            'SELECT id FROM asset WHERE id NOT IN (SELECT rowid FROM asset_search) '
+            'UNION SELECT rowid FROM asset_search WHERE rowid NOT IN (SELECT id FROM asset)'
+        ))]
+    for i in range(0, len(pending), batch_size):
+        chunk = pending[i:i + batch_size]
+        sync_asset_search(chunk)
+        db.session.commit()
+    db.session.commit()
+    return len(pending)
+
+def asset_search_terms(value):
+    terms = [t for t in (value or '').split() if t]
+    if not terms or min(len(t) for t in terms) < ASSET_SEARCH_MIN_TERM:
+        return None
+    return terms
+
+def fts_match_expression(terms, columns=None):
+    scope = '{' + ' '.join(columns) + '} : ' if columns else ''
+    return ' AND '.join(scope + '"' + t.replace('"', '""') + '"' for t in terms)
+
+def asset_search_filter(value, columns):
+    # Substring filter, same as the LIKE fallback: the whole value is one trigram phrase
+    value = (value or '').strip()
+    if len(value) >= ASSET_SEARCH_MIN_TERM and asset_search_state['backend'] == 'fts5':
+        match = text('SELECT rowid FROM asset_search WHERE asset_search MATCH :match').bindparams(match=fts_match_expression([value], columns))
+        return Asset.id.in_(match.columns(rowid=db.Integer))
+    return db.or_(*[getattr(Asset, c).ilike(f"%{value}%") for c in columns])
+
+def search_assets(q, value, limit=50):
+    terms = asset_search_terms(value)
+    backend = asset_search_state['backend']
+    if terms and backend == 'fts5':
+        ranked = text(
+            f'SELECT rowid AS asset_id, bm25(asset_search, {ASSET_SEARCH_WEIGHTS}) AS rank '
+            'FROM asset_search WHERE asset_search MATCH :match'
+        ).bindparams(match=fts_match_expression(terms)).columns(asset_id=db.Integer, rank=db.Float).subquery()
+        return q.join(ranked, ranked.c.asset_id == Asset.id).order_by(ranked.c.rank, Asset.id.desc()).limit(limit).all()
+    document = literal_column(asset_search_document_sql('asset.'))
+    value = (value or '').strip()
+    if not value:
+        return []
+    for term in (terms or [value]):
+        pattern = f"%{term}%"
+        commented = db.session.query(AssetComment.asset_id).filter(AssetComment.content.ilike(pattern))
+        q = q.filter(document.ilike(pattern) | Asset.id.in_(commented))
+    if backend == 'trgm':
+        return q.order_by(func.word_similarity(value, document).desc(), Asset.id.desc()).limit(limit).all()
+    return q.order_by(Asset.id.desc()).limit(limit).all()
+
+AUTOCOMPLETE_FIELDS = ['assigned_to', 'supplier', 'donor_name']
+
+class AutocompleteIndex:
+    def __init__(self, fields, max_age):
+        self.fields = fields
+        self.max_age = max_age
+        self.lock = threading.Lock()
+        self.load_lock = threading.Lock()
+        self.buckets = {}
+        self.loaded_at = None
+
+    def load(self):
+        buckets = {}
+        for field in self.fields:
+            column = getattr(Asset, field)
+            rows = (db.session.query(func.coalesce(Asset.province, ''), func.coalesce(Asset.district, ''), column, func.count())
+                    .filter(column.isnot(None), column != '')
+                    .group_by(Asset.province, Asset.district, column))
+            for province, district, value, n in rows:
+                bucket = buckets.setdefault((field, province, district), {'keys': [], 'counts': {}})
+                bucket['counts'][value] = bucket['counts'].get(value, 0) + n
+        for bucket in buckets.values():
+            bucket['keys'] = sorted((v.casefold(), v) for v in bucket['counts'])
+        with self.lock:
+            self.buckets = buckets
+            self.loaded_at = time.monotonic()
+
+    def stale(self):
+        return self.loaded_at is None or time.monotonic() - self.loaded_at > self.max_age
+
+    def ensure_loaded(self):
+        if not self.stale():
+            return
+        # Only one request rebuilds; the others wait here and then reuse its result
+        with self.load_lock:
+            if self.stale():
+                self.load()
+
+    def bump(self, field, province, district, value, delta):
+        if not value:
+            return
+        bucket = self.buckets.setdefault((field, province or '', district or ''), {'keys': [], 'counts': {}})
+        n = bucket['counts'].get(value, 0) + delta
+        key = (value.casefold(), value)
+        if n > 0:
+            if value not in bucket['counts']:
+                bisect.insort(bucket['keys'], key)
+            bucket['counts'][value] = n
+        elif value in bucket['counts']:
+            del bucket['counts'][value]
+            i = bisect.bisect_left(bucket['keys'], key)
+            if i < len(bucket['keys']) and bucket['keys'][i] == key:
+                del bucket['keys'][i]
+
+    def update(self, old_key, new_key):
+        if old_key == new_key or self.loaded_at is None:
+            return
+        with self.lock:
+            for key, delta in ((old_key, -1), (new_key, 1)):
+                if not key:
+                    continue
+                province, district = key[0], key[1]
+                for field, value in zip(self.fields, key[2:]):
+                    self.bump(field, province, district, value, delta)
+
+    def scoped_buckets(self, field, scope):
+        for (f, province, district), bucket in self.buckets.items():
+            if f != field:
+                continue
+            if scope and (province != scope[0] or (scope[1] and district != scope[1])):
+                continue
+            yield bucket
+
+    def lookup(self, field, prefix, scope=None, limit=10):
+        self.ensure_loaded()
+        prefix = prefix.casefold()
+        found = set()
+        with self.lock:
+            for bucket in self.scoped_buckets(field, scope):
+                keys = bucket['keys']
+                i = bisect.bisect_left(keys, (prefix, ''))
+                while i < len(keys) and keys[i][0].startswith(prefix) and len(found) < limit * 4:
+                    found.add(keys[i][1])
+                    i += 1
+        return sorted(found, key=str.casefold)[:limit]
+
+    def values(self, field, scope=None):
+        self.ensure_loaded()
+        with self.lock:
+            found = {v for bucket in self.scoped_buckets(field, scope) for v in bucket['counts']}
+        return sorted(found, key=str.casefold)
+
+autocomplete_index = AutocompleteIndex(AUTOCOMPLETE_FIELDS, app.config['AUTOCOMPLETE_REFRESH_SECONDS'])
+
+def autocomplete_key(asset):
+    return (asset.province or '', asset.district or '') + tuple((getattr(asset, f) or '').strip() for f in AUTOCOMPLETE_FIELDS)
+
+def user_location_scope():
+    u = current_user()
+    if not u or u.role == 'IT' or u.province == 'Head Office':
+        return None
+    district = None
+    if u.district and (u.role == 'AdminDistrict' or ',' not in u.district):
+        district = u.district
+    return (u.province or '', district)
+
+@app.cli.command('reindex-search')
+@click.option('--full', is_flag=True, help='Rebuild every asset instead of only missing or orphaned entries.')
+def reindex_search_command(full):
+    backend = ensure_asset_search()
+    if backend != 'fts5':
+        print(f"Search backend: {backend or 'none (LIKE fallback)'}; nothing to reindex")
+        return
+    count = reindex_asset_search(full=full)
+    print(f"Search index {'rebuilt' if full else 'repaired'}: {count} assets")
+
+class AuditLogWriter:
+    _stop = object()
+
+    def __init__(self, app):
+        self.app = app
+        self.queue = queue.Queue(maxsize=app.config['AUDIT_LOG_QUEUE_SIZE'])
+        self.thread = None
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.counters_lock = threading.Lock()
+
+    def ensure_started(self):
+        if self.thread and self.thread.is_alive():
+            return
+        with self.lock:
+            if self.thread and self.thread.is_alive():
+                return
+            self.thread = threading.Thread(target=self.run, name='audit-log-writer', daemon=True)
+            self.thread.start()
+
+    def enqueue(self, entry):
+        self.ensure_started()
+        try:
+            self.queue.put_nowait(entry)
+        except queue.Full:
+            return False
+        return True
+
+    def count(self, key, timestamp):
+        self.ensure_started()
+        with self.counters_lock:
+            n, _ = self.counters.get(key, (0, None))
+            self.counters[key] = (n + 1, timestamp)
+
+    def run(self):
+        batch_size = self.app.config['AUDIT_LOG_BATCH_SIZE']
+        interval = self.app.config['AUDIT_LOG_FLUSH_SECONDS']
+        rollup_interval = self.app.config['AUDIT_ROLLUP_FLUSH_SECONDS']
+        batch = []
+        waiters = []
+        deadline = None
+        counters_due = time.monotonic() + rollup_interval
+        while True:
+            timeout = interval if not batch else max(0, deadline - time.monotonic())
+            timeout = min(timeout, max(0, counters_due - time.monotonic()))
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+            elif item is not None and item is not self._stop:
+                if not batch:
+                    deadline = time.monotonic() + interval
+                batch.append(item)
+            if batch and (item is self._stop or waiters or len(batch) >= batch_size or time.monotonic() >= deadline):
+                self.write(batch)
+                batch = []
+            if item is self._stop or waiters or time.monotonic() >= counters_due:
+                self.write_counters()
+                counters_due = time.monotonic() + rollup_interval
+            for waiter in waiters:
+                waiter.set()
+            waiters = []
+            if item is self._stop:
+                return
+
+    def save(self, items, save_items, what):
+        # Retry the whole batch once (usually "database is locked"), then fall back to
+        # one item per transaction so a single bad row cannot drop the others
+        with self.app.app_context():
+            for attempt in range(2):
+                try:
+                    save_items(items)
+                    db.session.commit()
+                    return
+                except Exception:
+                    db.session.rollback()
+                    self.app.logger.exception('Writing %d %s failed (attempt %d)', len(items), what, attempt + 1)
+            for item in items:
+                try:
+                    save_items([item])
+                    db.session.commit()
+                except Exception:
+                    db.session.rollback()
+                    self.app.logger.exception('Dropped %s entry %r', what, item)
+
+    def write(self, batch):
+        self.save(batch, lambda rows: db.session.execute(AuditLog.__table__.insert(), rows), 'audit log')
+
+    def write_counters(self):
+        with self.counters_lock:
+            counters, self.counters = self.counters, {}
+        if not counters:
+            return
+        def bump(items):
+            for key, (n, last_seen) in items:
+                bump_audit_counter(key, n, last_seen)
+        self.save(list(counters.items()), bump, 'audit counter')
+
+    def flush(self, timeout=10):
+        if not (self.thread and self.thread.is_alive()):
+            return
+        done = threading.Event()
+        self.queue.put(done)
+        done.wait(timeout)
+
+    def stop(self, timeout=10):
+        if not (self.thread and self.thread.is_alive()):
+            return
+        self.queue.put(self._stop)
+        self.thread.join(timeout)
+
+audit_writer = AuditLogWriter(app)
+atexit.register(audit_writer.stop)
+
+def log_action(action, entity_type=None, entity_id=None, details=None, commit=True):
+    try:
+        entry = {
+            'timestamp': datetime.utcnow(),
+            'actor_user_id': current_user().id if current_user() else None,
+            'action': action,
+            'entity_type': entity_type,
+            'entity_id': entity_id,
+            'details': details,
+        }
+        if not commit:
+            db.session.add(AuditLog(**entry))
+            return
+        if action in app.config['AUDIT_ROLLUP_ACTIONS']:
+            key = (
+                entry['timestamp'].replace(minute=0, second=0, microsecond=0),
+                entry['actor_user_id'] or 0,
+                action,
+                entity_type or '',
+                entity_id or 0,
+                '' if entity_id else (details or '')[:255],
+            )
+            if app.config.get('AUDIT_LOG_ASYNC'):
+                audit_writer.count(key, entry['timestamp'])
+                return
+            bump_audit_counter(key, 1, entry['timestamp'])
+            db.session.commit()
+            return
+        if app.config.get('AUDIT_LOG_ASYNC') and audit_writer.enqueue(entry):
+            return
+        db.session.add(AuditLog(**entry))
         db.session.commit()
     except Exception:
         pass
 
-def log_asset_activity(asset_id, action, field=None, old_value=None, new_value=None, details=None):
+def log_asset_activity(asset_id, action, field=None, old_value=None, new_value=None, details=None, commit=True):
     try:
         entry = AssetActivity(
             asset_id=asset_id,
@@ -371,7 +1259,8 @@ def log_asset_activity(asset_id, action, field=None, old_value=None, new_value=N
             details=details
         )
         db.session.add(entry)
-        db.session.commit()
+        if commit:
+            db.session.commit()
     except Exception:
         pass
 
@@ -402,47 +1291,207 @@ def send_email(to_email, subject, body):
     def __repr__(self):
         return f'<Asset {self.name}>'
 
+def asset_summary(q, model=Asset):
+    if model is InventorySummary:
+        weight = InventorySummary.asset_count
+        tally = func.sum(InventorySummary.asset_count)
+    else:
+        weight = 1
+        tally = func.count(Asset.id)
+    totals = q.with_entities(
+        tally,
+        func.sum(case((model.type.in_(['Laptop', 'Desktop', 'All-in-One']), weight), else_=0)),
+        func.sum(case((model.type.in_(['Cellphone', 'Tablet']), weight), else_=0)),
+        func.sum(case((model.category == 'Furniture', weight), else_=0)),
+        func.sum(case((model.status == 'In Use', weight), else_=0)),
+        func.sum(case((model.inspected_by_ict == True, 0), else_=weight)),
+    ).one()
+    stats = {
+        'total': totals[0] or 0,
+        'computers': totals[1] or 0,
+        'mobile': totals[2] or 0,
+        'furniture': totals[3] or 0,
+        'in_use': totals[4] or 0,
+        'uninspected': totals[5] or 0,
+    }
+    type_counts = dict(
+        q.with_entities(model.type, tally)
+        .group_by(model.type)
+        .having(tally > 0)
+        .order_by(tally.desc(), model.type)
+        .all()
+    )
+    top_provinces = [
+        (province, count) for province, count in q.with_entities(model.province, tally)
+        .filter(model.province.isnot(None), model.province != '')
+        .group_by(model.province)
+        .having(tally > 0)
+        .order_by(tally.desc(), model.province)
+        .limit(6)
+        .all()
+    ]
+    return stats, type_counts, top_provinces
+
+def status_counts_for(q, model=Asset):
+    tally = func.sum(InventorySummary.asset_count) if model is InventorySummary else func.count(Asset.id)
+    counts = {s: 0 for s in ALLOWED_ASSET_STATUSES}
+    for status, count in q.with_entities(model.status, tally).group_by(model.status).all():
+        s = (status or '').strip()
+        if s in counts:
+            counts[s] += count or 0
+    return counts
+
+def summary_report_query(report_type):
+    if report_type not in ['all', 'computers_health', 'inspections', 'uninspected', 'archived_auctioned', 'furniture_general']:
+        return None
+    for param in ['assigned_to', 'supplier', 'start_date', 'end_date']:
+        if (request.args.get(param) or '').strip():
+            return None
+    q = filter_by_user_location(InventorySummary.query, InventorySummary)
+    # The summary stores NULL status/category as ''; exclude those rows where the Asset
+    # predicate would drop NULLs so both sources count the same assets.
+    if report_type == 'all':
+        q = q.filter(InventorySummary.status != '', ~InventorySummary.status.in_(LOCKED_ASSET_STATUSES))
+    elif report_type == 'computers_health':
+        q = q.filter(InventorySummary.type.in_(['Laptop', 'Desktop', 'All-in-One']))
+    elif report_type == 'inspections':
+        q = q.filter(InventorySummary.inspected_by_ict == True)
+    elif report_type == 'uninspected':
+        q = q.filter(InventorySummary.inspected_by_ict == False)
+    elif report_type == 'archived_auctioned':
+        q = q.filter(InventorySummary.status.in_(LOCKED_ASSET_STATUSES))
+    elif report_type == 'furniture_general':
+        q = q.filter(InventorySummary.category != '', InventorySummary.category != 'ICT')
+    province = (request.args.get('province') or '').strip()
+    district = (request.args.get('district') or '').strip()
+    status = (request.args.get('status') or '').strip()
+    if status:
+        q = q.filter(InventorySummary.status == status)
+    if province:
+        q = q.filter(InventorySummary.province == province)
+        if province != 'Head Office' and district:
+            q = q.filter(InventorySummary.district == district)
+    elif district:
+        q = q.filter(InventorySummary.district == district)
+    if request.args.get('uninspected') == 'on':
+        q = q.filter(InventorySummary.inspected_by_ict == False)
+    return q
+
+def parse_cursor(value):
+    try:
+        cursor = int(value)
+    except (TypeError, ValueError):
+        return None
+    return cursor if cursor > 0 else None
+
+def keyset_page(q, after=None, before=None, per_page=DASHBOARD_PAGE_SIZE):
+    if before:
+        rows = q.filter(Asset.id < before).order_by(Asset.id.desc()).limit(per_page + 1).all()
+        has_prev = len(rows) > per_page
+        rows = list(reversed(rows[:per_page]))
+        has_next = True
+    else:
+        if after:
+            q = q.filter(Asset.id > after)
+        rows = q.order_by(Asset.id).limit(per_page + 1).all()
+        has_next = len(rows) > per_page
+        rows = rows[:per_page]
+        has_prev = bool(after)
+    return {
+        'rows': rows,
+        'next_cursor': rows[-1].id if rows and has_next else None,
+        'prev_cursor': rows[0].id if rows and has_prev else None,
+    }
+
+def locked_asset_filter():
+    return func.trim(Asset.status).in_(LOCKED_ASSET_STATUSES)
+
+def active_asset_filter():
+    return Asset.status.is_(None) | ~locked_asset_filter()
+
+def dashboard_tab_query(q, tab):
+    active = active_asset_filter()
+    if tab == 'archived':
+        return q.filter(locked_asset_filter())
+    if tab == 'general':
+        return q.filter(active).filter(Asset.category.isnot(None), Asset.category != '', Asset.category != 'ICT')
+    return q.filter(active).filter(Asset.category.is_(None) | (Asset.category == '') | (Asset.category == 'ICT'))
+
 @app.route('/')
 @login_required
 def index():
-    q = Asset.query
-    q = filter_by_user_location(q)
     name_q = (request.args.get('name') or '').strip()
     serial_q = (request.args.get('serial') or '').strip()
-    if name_q:
-        q = q.filter(Asset.name.ilike(f"%{name_q}%"))
-    if serial_q:
-        q = q.filter(Asset.serial_number.ilike(f"%{serial_q}%"))
-    all_assets = q.all()
-    assets = [a for a in all_assets if (a.status or '').strip() not in LOCKED_ASSET_STATUSES]
-    archived_auctioned_assets = [a for a in all_assets if (a.status or '').strip() in LOCKED_ASSET_STATUSES]
-    stats = {
-        'total': len(assets),
-        'computers': sum(1 for a in assets if a.type in ['Laptop', 'Desktop', 'All-in-One']),
-        'mobile': sum(1 for a in assets if a.type in ['Cellphone', 'Tablet']),
-        'furniture': sum(1 for a in assets if a.category == 'Furniture'),
-        'in_use': sum(1 for a in assets if a.status == 'In Use'),
-        'uninspected': sum(1 for a in assets if not a.inspected_by_ict),
-    }
-    type_counts = {}
-    for a in assets:
-        type_counts[a.type] = type_counts.get(a.type, 0) + 1
-    province_counts = {}
-    for a in assets:
-        if a.province:
-            province_counts[a.province] = province_counts.get(a.province, 0) + 1
-    top_provinces = sorted(province_counts.items(), key=lambda x: x[1], reverse=True)[:6]
+    validator = data_version_validator()
     log_action('view_dashboard', details=f"name={name_q},serial={serial_q}")
-    return render_template(
+    not_modified = not_modified_response(validator)
+    if not_modified:
+        return not_modified
+    q = Asset.query
+    q = filter_by_user_location(q)
+    if name_q:
+        q = q.filter(asset_search_filter(name_q, ['name']))
+    if serial_q:
+        q = q.filter(asset_search_filter(serial_q, ['serial_number']))
+    active_tab = request.args.get('tab') if request.args.get('tab') in DASHBOARD_TABS else DASHBOARD_TABS[0]
+    cursors = {}
+    for tab in DASHBOARD_TABS:
+        for direction in ('after', 'before'):
+            cursor = parse_cursor(request.args.get(f'{tab}_{direction}'))
+            if cursor:
+                cursors[f'{tab}_{direction}'] = cursor
+    base_args = {k: v for k, v in (('name', name_q), ('serial', serial_q)) if v}
+    pages = {}
+    for tab in DASHBOARD_TABS:
+        page = keyset_page(
+            dashboard_tab_query(q, tab),
+            after=cursors.get(f'{tab}_after'),
+            before=cursors.get(f'{tab}_before'),
+        )
+        other_cursors = {k: v for k, v in cursors.items() if not k.startswith(f'{tab}_')}
+        page['next_url'] = url_for('index', tab=tab, **base_args, **other_cursors, **{f'{tab}_after': page['next_cursor']}) if page['next_cursor'] else None
+        page['prev_url'] = url_for('index', tab=tab, **base_args, **other_cursors, **{f'{tab}_before': page['prev_cursor']}) if page['prev_cursor'] else None
+        pages[tab] = page
+    if name_q or serial_q:
+        stats, type_counts, top_provinces = asset_summary(q.filter(active_asset_filter()))
+    else:
+        summary_q = filter_by_user_location(InventorySummary.query, InventorySummary)
+        summary_q = summary_q.filter(~func.trim(InventorySummary.status).in_(LOCKED_ASSET_STATUSES))
+        stats, type_counts, top_provinces = asset_summary(summary_q, InventorySummary)
+    return apply_validator(make_response(render_template(
         'index.html',
-        assets=assets,
-        archived_auctioned_assets=archived_auctioned_assets,
+        ict_page=pages['ict'],
+        general_page=pages['general'],
+        archived_page=pages['archived'],
+        active_tab=active_tab,
         stats=stats,
         type_counts=type_counts,
         top_provinces=top_provinces,
         name_q=name_q,
         serial_q=serial_q,
-    )
+    )), validator)
+
+@app.route('/search')
+@login_required
+def search():
+    search_q = (request.args.get('q') or '').strip()
+    results = search_assets(filter_by_user_location(Asset.query), search_q) if search_q else []
+    if search_q:
+        log_action('view_search', details=search_q)
+    return render_template('search.html', results=results, search_q=search_q)
+
+@app.route('/autocomplete/<field>')
+@login_required
+def autocomplete(field):
+    if field not in AUTOCOMPLETE_FIELDS:
+        abort(404)
+    prefix = (request.args.get('q') or '').strip()
+    try:
+        limit = min(max(int(request.args.get('limit') or 10), 1), 50)
+    except ValueError:
+        limit = 10
+    values = autocomplete_index.lookup(field, prefix, user_location_scope(), limit) if prefix else []
+    return jsonify({'field': field, 'q': prefix, 'values': values})
 
 @app.route('/add', methods=['GET', 'POST'])
 @login_required
@@ -573,9 +1622,11 @@ def add_asset():
                 inspection_date=inspection_date,
                 created_by_user_id=current_user().id if current_user() else None,
             )
+            new_asset.refresh_lifecycle_dates()
             db.session.add(new_asset)
-            db.session.commit()
-            
+            adjust_inventory_summary(None, inventory_summary_key(new_asset))
+            db.session.flush()
+
             # Initial comment if any
             if general_comments and general_comments.strip():
                 init_comment = AssetComment(
@@ -584,7 +1635,6 @@ def add_asset():
                     content=general_comments.strip()
                 )
                 db.session.add(init_comment)
-                db.session.commit()
 
             uploads_dir = Path(app.config['UPLOAD_FOLDER'])
             uploads_dir.mkdir(parents=True, exist_ok=True)
@@ -602,7 +1652,7 @@ def add_asset():
                     stored_filename=stored,
                 )
                 db.session.add(doc_entry)
-                log_asset_activity(new_asset.id, 'upload_document', field='loss_evidence', old_value='', new_value=loss_file.filename)
+                log_asset_activity(new_asset.id, 'upload_document', field='loss_evidence', old_value='', new_value=loss_file.filename, commit=False)
 
             if specification_file and specification_file.filename:
                 ts = datetime.utcnow().strftime('%Y%m%d%H%M%S%f')
@@ -617,7 +1667,7 @@ def add_asset():
                     stored_filename=stored,
                 )
                 db.session.add(spec_entry)
-                log_asset_activity(new_asset.id, 'upload_document', field='specification', old_value='', new_value=specification_file.filename)
+                log_asset_activity(new_asset.id, 'upload_document', field='specification', old_value='', new_value=specification_file.filename, commit=False)
 
             if is_it() and inspection_file and inspection_file.filename:
                 ts = datetime.utcnow().strftime('%Y%m%d%H%M%S%f')
@@ -632,19 +1682,43 @@ def add_asset():
                     stored_filename=stored,
                 )
                 db.session.add(doc_entry)
-                log_asset_activity(new_asset.id, 'upload_document', field='inspection', old_value='', new_value=inspection_file.filename)
+                log_asset_activity(new_asset.id, 'upload_document', field='inspection', old_value='', new_value=inspection_file.filename, commit=False)
 
+            log_asset_activity(new_asset.id, 'create', commit=False)
+            log_action('add_asset', 'Asset', new_asset.id, new_asset.name, commit=False)
+            sync_asset_search([new_asset.id])
+            bump_data_version([new_asset.province])
+            new_autocomplete_key = autocomplete_key(new_asset)
             db.session.commit()
-            log_action('add_asset', 'Asset', new_asset.id, new_asset.name)
-            log_asset_activity(new_asset.id, 'create')
+            autocomplete_index.update(None, new_autocomplete_key)
             flash('Asset added successfully!', 'success')
             return redirect(url_for('index'))
         except Exception as e:
+            db.session.rollback()
             log_action('add_asset_error', 'Asset', None, str(e))
             flash(f'Error adding asset: {e}', 'danger')
     
     return render_template('add_asset.html')
 
+def normalize_asset_status(status):
+    status = (status or '').strip()
+    return 'Lost / Stolen' if status == 'Lost' else status
+
+def status_change_note(current_status, new_status):
+    # The note a status change has to carry, as (activity action, error message)
+    if current_status == 'Lost / Stolen' and new_status != 'Lost / Stolen':
+        return 'recover', 'Recovery notes are required when recovering a Lost / Stolen asset'
+    if current_status == 'Broken' and new_status in ['In Stock', 'In Use']:
+        return 'repair', 'Repair notes are required when marking a Broken asset as Repaired'
+    return None
+
+def activity_value(field, value):
+    if isinstance(Asset.__table__.c[field].type, db.Boolean):
+        return 'Yes' if value else 'No'
+    if isinstance(value, date):
+        return value.isoformat()
+    return value or ''
+
 @app.route('/edit/<int:id>', methods=['GET', 'POST'])
 @login_required
 def edit_asset(id):
@@ -658,15 +1732,11 @@ def edit_asset(id):
         return redirect(url_for('index'))
     existing_loss_doc = AssetDocument.query.filter_by(asset_id=asset.id, doc_type='loss_evidence').order_by(AssetDocument.timestamp.desc()).first()
     if request.method == 'POST':
-        current_status = (asset.status or '').strip()
-        if current_status == 'Lost':
-            current_status = 'Lost / Stolen'
+        current_status = normalize_asset_status(asset.status)
 
         u = current_user()
 
-        posted_status = (request.form.get('status') or '').strip() or current_status
-        if posted_status == 'Lost':
-            posted_status = 'Lost / Stolen'
+        posted_status = normalize_asset_status(request.form.get('status')) or current_status
         if posted_status not in ALLOWED_ASSET_STATUSES:
             flash('Invalid status selected', 'danger')
             return render_template('edit_asset.html', asset=asset, existing_loss_doc=existing_loss_doc)
@@ -713,13 +1783,12 @@ def edit_asset(id):
             if not loss_file and not existing_loss_doc:
                 flash('Police report / evidence document is required for Lost / Stolen assets', 'danger')
                 return render_template('edit_asset.html', asset=asset, existing_loss_doc=existing_loss_doc)
-        if current_status == 'Lost / Stolen' and posted_status != 'Lost / Stolen':
-            if not recovery_note:
-                flash('Recovery notes are required when recovering a Lost / Stolen asset', 'danger')
-                return render_template('edit_asset.html', asset=asset, existing_loss_doc=existing_loss_doc)
-        if current_status == 'Broken' and posted_status in ['In Stock', 'In Use'] and posted_status != current_status:
-            if not repair_note:
-                flash('Repair notes are required when marking a Broken asset as Repaired', 'danger')
+        required_note = status_change_note(current_status, posted_status)
+        transition_note = None
+        if required_note:
+            transition_note = repair_note if required_note[0] == 'repair' else recovery_note
+            if not transition_note:
+                flash(required_note[1], 'danger')
                 return render_template('edit_asset.html', asset=asset, existing_loss_doc=existing_loss_doc)
         if posted_status == 'In Use' and not posted_assigned_to:
             flash('Assigned To is required when status is In Use', 'danger')
@@ -749,20 +1818,17 @@ def edit_asset(id):
         if immutable_attempted:
             flash('Some fields are immutable and were not changed', 'warning')
 
-        old_values = {
-            'province': asset.province,
-            'district': asset.district,
-            'assigned_to': asset.assigned_to,
-            'status': asset.status,
-            'os_name': asset.os_name,
-            'antivirus_name': asset.antivirus_name,
-            'antivirus_license_date': asset.antivirus_license_date.isoformat() if asset.antivirus_license_date else None,
-            'office_name': asset.office_name,
-            'office_license_date': asset.office_license_date.isoformat() if asset.office_license_date else None,
-            'inspected_by_ict': 'Yes' if asset.inspected_by_ict else 'No',
-            'inspection_date': asset.inspection_date.isoformat() if asset.inspection_date else None,
-            'last_service_date': asset.last_service_date.isoformat() if asset.last_service_date else None,
-        }
+        tracked_fields = [
+            ('update', 'province'), ('update', 'district'), ('update', 'assigned_to'),
+            ('software', 'os_name'), ('software', 'antivirus_name'), ('software', 'antivirus_license_date'),
+            ('software', 'office_name'), ('software', 'office_license_date'),
+            ('inspection', 'inspected_by_ict'), ('inspection', 'inspection_date'),
+            ('routine_service', 'last_service_date'),
+        ]
+        old_province = asset.province
+        old_values = {field: activity_value(field, getattr(asset, field)) for _, field in tracked_fields}
+        old_summary_key = inventory_summary_key(asset)
+        old_autocomplete_key = autocomplete_key(asset)
 
         try:
             posted_antivirus_license_date = datetime.strptime(posted_antivirus_license_date_str, '%Y-%m-%d').date() if posted_antivirus_license_date_str else None
@@ -826,7 +1892,7 @@ def edit_asset(id):
                         stored_filename=stored,
                     )
                     db.session.add(doc_entry)
-                    log_asset_activity(asset.id, 'upload_document', field='inspection', old_value='', new_value=inspection_file.filename)
+                    log_asset_activity(asset.id, 'upload_document', field='inspection', old_value='', new_value=inspection_file.filename, commit=False)
 
             if loss_file and loss_file.filename:
                 ts = datetime.utcnow().strftime('%Y%m%d%H%M%S%f')
@@ -841,7 +1907,7 @@ def edit_asset(id):
                     stored_filename=stored,
                 )
                 db.session.add(doc_entry)
-                log_asset_activity(asset.id, 'upload_document', field='loss_evidence', old_value='', new_value=loss_file.filename)
+                log_asset_activity(asset.id, 'upload_document', field='loss_evidence', old_value='', new_value=loss_file.filename, commit=False)
 
             changes = []
             def add_change(action, field, old_val, new_val):
@@ -855,42 +1921,32 @@ def edit_asset(id):
                         new_value=new_val
                     ))
 
-            add_change('update', 'province', old_values['province'] or '', asset.province or '')
-            add_change('update', 'district', old_values['district'] or '', asset.district or '')
-            add_change('update', 'assigned_to', old_values['assigned_to'] or '', asset.assigned_to or '')
+            for action, field in tracked_fields[:3]:
+                add_change(action, field, old_values[field], activity_value(field, getattr(asset, field)))
             add_change('status', 'status', (current_status or ''), asset.status or '')
-            add_change('software', 'os_name', old_values['os_name'] or '', asset.os_name or '')
-            add_change('software', 'antivirus_name', old_values['antivirus_name'] or '', asset.antivirus_name or '')
-            add_change('software', 'antivirus_license_date', old_values['antivirus_license_date'] or '', asset.antivirus_license_date.isoformat() if asset.antivirus_license_date else '')
-            add_change('software', 'office_name', old_values['office_name'] or '', asset.office_name or '')
-            add_change('software', 'office_license_date', old_values['office_license_date'] or '', asset.office_license_date.isoformat() if asset.office_license_date else '')
-            add_change('inspection', 'inspected_by_ict', old_values['inspected_by_ict'] or '', 'Yes' if asset.inspected_by_ict else 'No')
-            add_change('inspection', 'inspection_date', old_values['inspection_date'] or '', asset.inspection_date.isoformat() if asset.inspection_date else '')
-            add_change('routine_service', 'last_service_date', old_values['last_service_date'] or '', asset.last_service_date.isoformat() if asset.last_service_date else '')
-            if current_status == 'Broken' and posted_status in ['In Stock', 'In Use'] and posted_status != current_status and repair_note:
-                changes.append(AssetActivity(
-                    asset_id=asset.id,
-                    actor_user_id=current_user().id if current_user() else None,
-                    action='repair',
-                    field='note',
-                    old_value='',
-                    new_value=repair_note
-                ))
-            if current_status == 'Lost / Stolen' and posted_status != 'Lost / Stolen' and recovery_note:
+            for action, field in tracked_fields[3:]:
+                add_change(action, field, old_values[field], activity_value(field, getattr(asset, field)))
+            if required_note:
                 changes.append(AssetActivity(
                     asset_id=asset.id,
                     actor_user_id=current_user().id if current_user() else None,
-                    action='recover',
+                    action=required_note[0],
                     field='note',
                     old_value='',
-                    new_value=recovery_note
+                    new_value=transition_note
                 ))
 
             if changes:
                 db.session.add_all(changes)
 
+            asset.refresh_lifecycle_dates()
+            adjust_inventory_summary(old_summary_key, inventory_summary_key(asset))
+            sync_asset_search([asset.id])
+            bump_data_version([old_province, asset.province])
+            log_action('edit_asset', 'Asset', asset.id, asset.name, commit=False)
+            new_autocomplete_key = autocomplete_key(asset)
             db.session.commit()
-            log_action('edit_asset', 'Asset', asset.id, asset.name)
+            autocomplete_index.update(old_autocomplete_key, new_autocomplete_key)
             if attempted_relocate:
                 flash('You have no right to relocate an asset to another district', 'warning')
             flash('Asset updated successfully!', 'success')
@@ -922,6 +1978,8 @@ def delete_asset(id):
             return redirect(url_for('view_asset', id=asset.id))
         old_status = asset.status or ''
         old_assigned = asset.assigned_to or ''
+        old_summary_key = inventory_summary_key(asset)
+        old_autocomplete_key = autocomplete_key(asset)
         asset.status = 'Archived'
         asset.assigned_to = None
         activities = [
@@ -944,7 +2002,12 @@ def delete_asset(id):
                 new_value=''
             ))
         db.session.add_all(activities)
+        adjust_inventory_summary(old_summary_key, inventory_summary_key(asset))
+        sync_asset_search([asset.id])
+        bump_data_version([asset.province])
+        new_autocomplete_key = autocomplete_key(asset)
         db.session.commit()
+        autocomplete_index.update(old_autocomplete_key, new_autocomplete_key)
         log_action('archive_asset', 'Asset', id, asset.name)
         flash('Asset archived successfully!', 'success')
     except Exception as e:
@@ -977,6 +2040,7 @@ def auction_asset(id):
 
     try:
         old_status = asset.status
+        old_summary_key = inventory_summary_key(asset)
         asset.status = 'Auctioned'
         
         # Log status change
@@ -997,7 +2061,9 @@ def auction_asset(id):
             content=f"Auctioned: {comment}"
         )
         db.session.add(new_comment)
-        
+        adjust_inventory_summary(old_summary_key, inventory_summary_key(asset))
+        sync_asset_search([asset.id])
+        bump_data_version([asset.province])
         db.session.commit()
         log_action('auction_asset', 'Asset', id, asset.name)
         flash('Asset auctioned successfully!', 'success')
@@ -1045,7 +2111,7 @@ def view_asset(id):
             actor_map[u.id] = u.username
     return render_template('view_asset.html', asset=asset, activities=activities, docs=docs, actor_map=actor_map)
 
-def get_report_assets(report_type):
+def report_assets_query(report_type):
     q = filter_by_user_location(Asset.query)
     # Base subsets by report_type
     if report_type == 'all':
@@ -1054,19 +2120,14 @@ def get_report_assets(report_type):
         q = q.filter(Asset.type.in_(['Laptop', 'Desktop', 'All-in-One']))
     elif report_type == 'routine_service_due':
         today = datetime.now().date()
-        due_cutoff = subtract_months(today, ROUTINE_SERVICE_INTERVAL_MONTHS)
-        due_soon_cutoff = subtract_months(today + timedelta(days=ROUTINE_SERVICE_DUE_SOON_DAYS), ROUTINE_SERVICE_INTERVAL_MONTHS)
         q = q.filter(~Asset.status.in_(LOCKED_ASSET_STATUSES))
         q = q.filter(Asset.type.in_(ROUTINE_SERVICE_TYPES))
-        q = q.filter(
-            (Asset.last_service_date.is_(None) & (Asset.purchase_date.isnot(None)) & (Asset.purchase_date <= due_soon_cutoff))
-            | (Asset.last_service_date.isnot(None) & (Asset.last_service_date <= due_soon_cutoff))
-        )
+        q = q.filter(Asset.routine_service_due_date <= today + timedelta(days=ROUTINE_SERVICE_DUE_SOON_DAYS))
     elif report_type == 'approaching_eol':
-        # handle via post-filtering because computed property
-        pass
+        today = datetime.now().date()
+        q = q.filter(Asset.eol_date > today, Asset.eol_date <= today + timedelta(days=EOL_WARNING_DAYS))
     elif report_type == 'past_eol':
-        pass
+        q = q.filter(Asset.eol_date <= datetime.now().date())
     elif report_type == 'inspections':
         q = q.filter(Asset.inspected_by_ict == True)
     elif report_type == 'uninspected':
@@ -1116,94 +2177,317 @@ def get_report_assets(report_type):
             q = q.filter(Asset.purchase_date <= end_date)
         except Exception:
             pass
+    return q
 
-    assets = q.all()
-    if report_type == 'approaching_eol':
-        assets = [a for a in assets if a.is_eol_approaching]
-    if report_type == 'past_eol':
-        assets = [a for a in assets if a.is_eol_passed]
-    return assets
+def report_asset_rows(report_type):
+    return report_assets_query(report_type).with_entities(*[getattr(Asset, c) for c in REPORT_ASSET_COLUMNS]).order_by(Asset.id)
 
-def asset_rows(assets, report_type='all'):
-    rows = []
-    for a in assets:
-        if report_type == 'furniture_general':
-            rows.append({
-                'ID': a.id,
-                'Name': a.name,
-                'Category': a.category,
-                'Type': a.type,
-                'Serial': a.serial_number,
-                'Purchase Date': a.purchase_date.isoformat() if a.purchase_date else '',
-                'Status': a.status,
-                'Assigned To': a.assigned_to or '',
-                'Location': f"{a.province or ''} / {a.district or ''}",
-                'Comments': a.general_comments or ''
-            })
+def get_report_assets(report_type):
+    key = report_cache_key('assets', report_type)
+    rows = report_cache.get(key)
+    if rows is None:
+        rows = tuple(report_asset_rows(report_type))
+        if len(rows) <= app.config['REPORT_CACHE_MAX_ROWS']:
+            report_cache.put(key, rows)
+    return [ReportAsset(r) for r in rows]
+
+def get_report_status_counts(report_type):
+    key = report_cache_key('status_counts', report_type)
+    status_counts = report_cache.get(key)
+    if status_counts is None:
+        if summary_report_query(report_type) is not None:
+            status_counts = status_counts_for(summary_report_query(report_type), InventorySummary)
         else:
-            row = {
-                'ID': a.id,
-                'Name': a.name,
-                'Type': a.type,
-                'Serial': a.serial_number,
-                'Purchase Date': a.purchase_date.isoformat() if a.purchase_date else '',
-                'Acquisition Type': a.acquisition_type or '',
-                'Status': a.status,
-                'Assigned To': a.assigned_to or '',
-                'Supplier': a.supplier or '',
-                'Donor Name': a.donor_name or '',
-                'Province': a.province or '',
-                'District': a.district or '',
-                'OS': a.os_name or '',
-                'Antivirus': a.antivirus_name or '',
-                'Antivirus License': a.antivirus_license_date.isoformat() if a.antivirus_license_date else '',
-                'Office': a.office_name or '',
-                'Office License': a.office_license_date.isoformat() if a.office_license_date else '',
-                'EOL Date': a.eol_date.isoformat() if a.eol_date else '',
-                'EOL Status': a.eol_status or '',
-                'Inspected': 'Yes' if a.inspected_by_ict else 'No',
-                'Inspection Date': a.inspection_date.isoformat() if a.inspection_date else '',
-            }
-            if report_type == 'routine_service_due':
-                row['Last Service Date'] = a.last_service_date.isoformat() if a.last_service_date else ''
-                row['Next Service Due'] = a.routine_service_due_date.isoformat() if a.routine_service_due_date else ''
-                if a.routine_service_due_date:
-                    row['Days To Due'] = (a.routine_service_due_date - datetime.now().date()).days
-                else:
-                    row['Days To Due'] = ''
-                if a.is_routine_service_due:
-                    row['Service Status'] = 'Due'
-                elif a.is_routine_service_due_soon:
-                    row['Service Status'] = f'Due Soon ({ROUTINE_SERVICE_DUE_SOON_DAYS} days)'
+            status_counts = status_counts_for(report_assets_query(report_type))
+        report_cache.put(key, status_counts)
+    return status_counts
+
+def asset_row(a, report_type='all'):
+    if report_type == 'furniture_general':
+        return {
+            'ID': a.id,
+            'Name': a.name,
+            'Category': a.category,
+            'Type': a.type,
+            'Serial': a.serial_number,
+            'Purchase Date': a.purchase_date.isoformat() if a.purchase_date else '',
+            'Status': a.status,
+            'Assigned To': a.assigned_to or '',
+            'Location': f"{a.province or ''} / {a.district or ''}",
+            'Comments': a.general_comments or ''
+        }
+    else:
+        row = {
+            'ID': a.id,
+            'Name': a.name,
+            'Type': a.type,
+            'Serial': a.serial_number,
+            'Purchase Date': a.purchase_date.isoformat() if a.purchase_date else '',
+            'Acquisition Type': a.acquisition_type or '',
+            'Status': a.status,
+            'Assigned To': a.assigned_to or '',
+            'Supplier': a.supplier or '',
+            'Donor Name': a.donor_name or '',
+            'Province': a.province or '',
+            'District': a.district or '',
+            'OS': a.os_name or '',
+            'Antivirus': a.antivirus_name or '',
+            'Antivirus License': a.antivirus_license_date.isoformat() if a.antivirus_license_date else '',
+            'Office': a.office_name or '',
+            'Office License': a.office_license_date.isoformat() if a.office_license_date else '',
+            'EOL Date': a.eol_date.isoformat() if a.eol_date else '',
+            'EOL Status': a.eol_status or '',
+            'Inspected': 'Yes' if a.inspected_by_ict else 'No',
+            'Inspection Date': a.inspection_date.isoformat() if a.inspection_date else '',
+        }
+        if report_type == 'routine_service_due':
+            row['Last Service Date'] = a.last_service_date.isoformat() if a.last_service_date else ''
+            row['Next Service Due'] = a.routine_service_due_date.isoformat() if a.routine_service_due_date else ''
+            if a.routine_service_due_date:
+                row['Days To Due'] = (a.routine_service_due_date - datetime.now().date()).days
+            else:
+                row['Days To Due'] = ''
+            if a.is_routine_service_due:
+                row['Service Status'] = 'Due'
+            elif a.is_routine_service_due_soon:
+                row['Service Status'] = f'Due Soon ({ROUTINE_SERVICE_DUE_SOON_DAYS} days)'
+            else:
+                row['Service Status'] = 'OK'
+        return row
+
+def asset_rows(assets, report_type='all'):
+    return [asset_row(a, report_type) for a in assets]
+
+def iter_report_assets(report_type):
+    cached = report_cache.get(report_cache_key('assets', report_type))
+    if cached is None:
+        cached = report_asset_rows(report_type).yield_per(EXPORT_BATCH_SIZE)
+    for r in cached:
+        yield ReportAsset(r)
+
+def report_fieldnames(report_type):
+    if report_type == 'movement':
+        return ['Date / Time','Asset ID','Name','Serial','Province','District','Action','Field','Old Value','New Value','User','Description']
+    if report_type == 'furniture_general':
+        return ['ID','Name','Category','Type','Serial','Purchase Date','Status','Assigned To','Location','Comments']
+    if report_type == 'routine_service_due':
+        return ['ID','Name','Type','Serial','Purchase Date','Acquisition Type','Status','Assigned To','Supplier','Donor Name','Province','District','OS','Antivirus','Antivirus License','Office','Office License','EOL Date','EOL Status','Inspected','Inspection Date','Last Service Date','Next Service Due','Days To Due','Service Status']
+    return ['ID','Name','Type','Serial','Purchase Date','Acquisition Type','Status','Assigned To','Supplier','Donor Name','Province','District','OS','Antivirus','Antivirus License','Office','Office License','EOL Date','EOL Status','Inspected','Inspection Date']
+
+def iter_csv(rows, fieldnames):
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=fieldnames, extrasaction='ignore')
+    writer.writeheader()
+    for i, r in enumerate(rows, 1):
+        writer.writerow(r)
+        if i % EXPORT_BATCH_SIZE == 0:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate(0)
+    yield buf.getvalue()
+
+def iter_word(rows, fieldnames, title):
+    yield (
+        "<html><head><meta charset='utf-8'></head><body>"
+        f"<h2>{escape(title)}</h2><table border='1' cellspacing='0' cellpadding='4'>"
+        "<tr>" + "".join(f"<th>{escape(h)}</th>" for h in fieldnames) + "</tr>"
+    )
+    chunk = []
+    for r in rows:
+        cells = []
+        for h in fieldnames:
+            value = r.get(h)
+            cells.append(f"<td>{escape('' if value is None else value)}</td>")
+        chunk.append("<tr>" + "".join(cells) + "</tr>")
+        if len(chunk) >= EXPORT_BATCH_SIZE:
+            yield "".join(chunk)
+            chunk = []
+    chunk.append("</table></body></html>")
+    yield "".join(chunk)
+
+def xlsx_cell(field, value):
+    if value is None or value == '':
+        return None
+    try:
+        if field in XLSX_INTEGER_COLUMNS:
+            return int(value)
+        if field in XLSX_DATE_COLUMNS:
+            return date.fromisoformat(value) if isinstance(value, str) else value
+        if field in XLSX_DATETIME_COLUMNS:
+            return datetime.fromisoformat(value) if isinstance(value, str) else value
+    except (TypeError, ValueError):
+        pass
+    return value
+
+def write_xlsx(rows, fieldnames, sheet_name):
+    import xlsxwriter
+    tmp = tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False)
+    tmp.close()
+    workbook = xlsxwriter.Workbook(tmp.name, {'constant_memory': True, 'tmpdir': tempfile.gettempdir()})
+    try:
+        ws = workbook.add_worksheet(sheet_name[:31])
+        header_fmt = workbook.add_format({'bold': True, 'bg_color': '#DCE6F1', 'border': 1})
+        date_fmt = workbook.add_format({'num_format': 'yyyy-mm-dd'})
+        datetime_fmt = workbook.add_format({'num_format': 'yyyy-mm-dd hh:mm:ss'})
+        for col, name in enumerate(fieldnames):
+            ws.set_column(col, col, max(12, len(name) + 2))
+            ws.write_string(0, col, name, header_fmt)
+        ws.freeze_panes(1, 0)
+        last_row = 0
+        for last_row, r in enumerate(rows, 1):
+            for col, name in enumerate(fieldnames):
+                value = xlsx_cell(name, r.get(name))
+                if value is None:
+                    continue
+                if isinstance(value, datetime):
+                    ws.write_datetime(last_row, col, value, datetime_fmt)
+                elif isinstance(value, date):
+                    ws.write_datetime(last_row, col, value, date_fmt)
+                elif isinstance(value, int):
+                    ws.write_number(last_row, col, value)
                 else:
-                    row['Service Status'] = 'OK'
-            rows.append(row)
-    return rows
+                    ws.write_string(last_row, col, str(value))
+        ws.autofilter(0, 0, last_row, max(len(fieldnames) - 1, 0))
+        workbook.close()
+    except Exception:
+        workbook.close()
+        os.remove(tmp.name)
+        raise
+    return tmp.name
+
+def pdf_string(text):
+    data = text.encode('cp1252', errors='replace')
+    return b'(' + data.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)') + b')'
+
+def write_pdf(rows, columns, title):
+    # Pages are written to the file as soon as they are full, so memory stays at one
+    # page plus the xref offsets no matter how long the report is.
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.units import cm
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    tmp = tempfile.NamedTemporaryFile(suffix='.pdf', delete=False)
+    tmp.close()
+    try:
+        width, height = landscape(A4)
+        margin = 1.2*cm
+        row_height = 0.5*cm
+        font_size = 7
+        total_weight = sum(w for _, w in columns)
+        col_widths = [(width - 2*margin) * w / total_weight for _, w in columns]
+        generated = datetime.now().strftime('%Y-%m-%d %H:%M')
+        fonts = {'Helvetica': b'F1', 'Helvetica-Bold': b'F2'}
+        offsets = {}
+        page_ids = []
+        ops = []
+        next_id = 5
+
+        def fit(text, max_width, font='Helvetica'):
+            if stringWidth(text, font, font_size) <= max_width:
+                return text
+            text = text[:int(len(text) * max_width / stringWidth(text, font, font_size)) + 1]
+            while text and stringWidth(text + '...', font, font_size) > max_width:
+                text = text[:-1]
+            return text + '...'
+
+        def draw(x, y, text, font='Helvetica', size=font_size, right=False):
+            if right:
+                x -= stringWidth(text, font, size)
+            ops.append(b'BT /%s %g Tf %.2f %.2f Td %s Tj ET' % (fonts[font], size, x, y, pdf_string(text)))
+
+        def fill_rect(x, y, w, h, gray):
+            ops.append(b'%.2f g %.2f %.2f %.2f %.2f re f 0 g' % (gray, x, y, w, h))
+
+        def write_obj(f, num, body):
+            offsets[num] = f.tell()
+            f.write(b'%d 0 obj\n' % num + body + b'\nendobj\n')
+
+        def start_page():
+            y = height - margin
+            draw(margin, y - 12, title, 'Helvetica-Bold', 12)
+            draw(width - margin, y - 12, f"{app.config.get('MINISTRY_NAME')} | Generated {generated}", size=7, right=True)
+            y -= 0.9*cm
+            fill_rect(margin, y - row_height, width - 2*margin, row_height, 0.85)
+            x = margin
+            for (name, _), w in zip(columns, col_widths):
+                draw(x + 2, y - row_height + 4, fit(name, w - 4, 'Helvetica-Bold'), 'Helvetica-Bold')
+                x += w
+            return y - row_height
+
+        def end_page(f):
+            nonlocal next_id
+            draw(width - margin, margin / 2, f'Page {len(page_ids) + 1}', size=7, right=True)
+            data = zlib.compress(b'\n'.join(ops))
+            ops.clear()
+            content_id, page_id = next_id, next_id + 1
+            next_id += 2
+            write_obj(f, content_id, b'<< /Length %d /Filter /FlateDecode >>\nstream\n' % len(data) + data + b'\nendstream')
+            write_obj(f, page_id, b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %.2f %.2f] /Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents %d 0 R >>' % (width, height, content_id))
+            page_ids.append(page_id)
+
+        with open(tmp.name, 'wb') as f:
+            f.write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+            y = start_page()
+            count = 0
+            for r in rows:
+                if y - row_height < margin:
+                    end_page(f)
+                    y = start_page()
+                if count % 2:
+                    fill_rect(margin, y - row_height, width - 2*margin, row_height, 0.95)
+                x = margin
+                for (name, _), w in zip(columns, col_widths):
+                    value = r.get(name)
+                    draw(x + 2, y - row_height + 4, fit('' if value is None else str(value), w - 4))
+                    x += w
+                y -= row_height
+                count += 1
+            if not count:
+                draw(margin + 2, y - row_height + 4, 'No data')
+            end_page(f)
+            write_obj(f, 1, b'<< /Type /Catalog /Pages 2 0 R >>')
+            write_obj(f, 2, b'<< /Type /Pages /Count %d /Kids [%s] >>' % (len(page_ids), b' '.join(b'%d 0 R' % i for i in page_ids)))
+            for font, key in fonts.items():
+                write_obj(f, 3 if key == b'F1' else 4, b'<< /Type /Font /Subtype /Type1 /BaseFont /%s /Encoding /WinAnsiEncoding >>' % font.encode())
+            xref = f.tell()
+            f.write(b'xref\n0 %d\n0000000000 65535 f \n' % next_id)
+            for num in range(1, next_id):
+                f.write(b'%010d 00000 n \n' % offsets[num])
+            f.write(b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (next_id, xref))
+    except Exception:
+        os.remove(tmp.name)
+        raise
+    return tmp.name
+
+def iter_file_chunks(path, chunk_size=64 * 1024):
+    try:
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+    finally:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
 
 @app.route('/reports')
 @login_required
 def reports():
     report_type = request.args.get('type', 'all')
+    validator = data_version_validator()
+    log_action('view_reports', details=report_type)
+    not_modified = not_modified_response(validator)
+    if not_modified:
+        return not_modified
     assets = []
     movements = []
     status_counts = None
     if report_type != 'movement':
         assets = get_report_assets(report_type)
-        status_counts = {s: 0 for s in ALLOWED_ASSET_STATUSES}
-        for a in assets:
-            s = (a.status or '').strip()
-            if s in status_counts:
-                status_counts[s] += 1
-    suppliers = [
-        r[0] for r in filter_by_user_location(Asset.query)
-        .with_entities(Asset.supplier)
-        .filter(Asset.supplier.isnot(None))
-        .filter(Asset.supplier != '')
-        .distinct()
-        .order_by(Asset.supplier)
-        .all()
-        if r[0]
-    ]
+        status_counts = get_report_status_counts(report_type)
+    suppliers = autocomplete_index.values('supplier', user_location_scope())
     if report_type == 'movement':
         q = db.session.query(AssetActivity, Asset).join(Asset, Asset.id == AssetActivity.asset_id)
         q = filter_by_user_location(q)
@@ -1293,22 +2577,24 @@ def reports():
                     'description': desc,
                 }
             )
-    log_action('view_reports', details=report_type)
-    return render_template(
+    return apply_validator(make_response(render_template(
         'reports.html',
         assets=assets,
         report_type=report_type,
         suppliers=suppliers,
         movements=movements,
         status_counts=status_counts,
-    )
+    )), validator)
 
 @app.route('/export/<fmt>')
 @login_required
 def export(fmt):
     report_type = request.args.get('type', 'all')
+    validator = data_version_validator()
+    not_modified = not_modified_response(validator, shared=True)
+    if not_modified:
+        return not_modified
     rows = []
-    assets = []
     filename_base = ''
     if report_type == 'movement':
         q = db.session.query(AssetActivity, Asset).join(Asset, Asset.id == AssetActivity.asset_id)
@@ -1398,86 +2684,696 @@ def export(fmt):
             })
         filename_base = f"movement_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
     else:
-        assets = get_report_assets(report_type)
-        rows = asset_rows(assets, report_type)
+        rows = (asset_row(a, report_type) for a in iter_report_assets(report_type))
         filename_base = f"report_{report_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
+    if fmt == 'excel':
+        try:
+            path = write_xlsx(rows, report_fieldnames(report_type), report_type)
+        except ImportError:
+            path = None
+        if path:
+            return apply_validator(Response(
+                iter_file_chunks(path),
+                mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+                headers={
+                    'Content-Disposition': f'attachment; filename="{filename_base}.xlsx"',
+                    'Content-Length': str(os.path.getsize(path)),
+                }
+            ), validator, shared=True)
     if fmt == 'csv' or fmt == 'excel':
-        si = io.StringIO()
-        fieldnames = []
-        if rows:
-            fieldnames = list(rows[0].keys())
-        else:
-            if report_type == 'furniture_general':
-                fieldnames = ['ID','Name','Category','Type','Serial','Purchase Date','Status','Assigned To','Location','Comments']
-            elif report_type == 'routine_service_due':
-                fieldnames = ['ID','Name','Type','Serial','Purchase Date','Acquisition Type','Status','Assigned To','Supplier','Donor Name','Province','District','OS','Antivirus','Antivirus License','Office','Office License','EOL Date','EOL Status','Inspected','Inspection Date','Last Service Date','Next Service Due','Days To Due','Service Status']
-            else:
-                fieldnames = ['ID','Name','Type','Serial','Purchase Date','Acquisition Type','Status','Assigned To','Supplier','Donor Name','Province','District','OS','Antivirus','Antivirus License','Office','Office License','EOL Date','EOL Status','Inspected','Inspection Date']
-        
-        writer = csv.DictWriter(si, fieldnames=fieldnames)
-        writer.writeheader()
-        for r in rows:
-            writer.writerow(r)
-        output = si.getvalue()
         content_type = 'text/csv' if fmt == 'csv' else 'application/vnd.ms-excel'
-        return Response(
-            output,
+        return apply_validator(Response(
+            stream_with_context(iter_csv(rows, report_fieldnames(report_type))),
             mimetype=content_type,
             headers={'Content-Disposition': f'attachment; filename="{filename_base}.csv"'}
-        )
+        ), validator, shared=True)
     if fmt == 'word':
-        html = "<html><body><h2>ICT Asset Report</h2><table border='1' cellspacing='0' cellpadding='4'>"
-        # header
-        headers = list(rows[0].keys()) if rows else []
-        if headers:
-            html += "<tr>" + "".join(f"<th>{h}</th>" for h in headers) + "</tr>"
-        for r in rows:
-            html += "<tr>" + "".join(f"<td>{(r.get(h) or '')}</td>" for h in headers) + "</tr>"
-        html += "</table></body></html>"
-        return Response(
-            html,
+        return apply_validator(Response(
+            stream_with_context(iter_word(rows, report_fieldnames(report_type), 'ICT Asset Report')),
             mimetype='application/msword',
             headers={'Content-Disposition': f'attachment; filename="{filename_base}.doc"'}
-        )
+        ), validator, shared=True)
     if fmt == 'pdf':
         try:
-            from reportlab.lib.pagesizes import A4
-            from reportlab.pdfgen import canvas
-            from reportlab.lib.units import cm
-            buf = io.BytesIO()
-            c = canvas.Canvas(buf, pagesize=A4)
-            width, height = A4
-            y = height - 2*cm
-            c.setFont("Helvetica-Bold", 14)
-            c.drawString(2*cm, y, "ICT Asset Report")
-            y -= 1*cm
-            c.setFont("Helvetica", 9)
-            for r in rows or []:
-                line = f"{r['ID']} | {r['Name']} | {r['Type']} | {r['Serial']} | {r['Status']} | {r.get('Supplier','')} | {r['Province']} | {r['District']} | EOL: {r['EOL Date']} {r['EOL Status']} | Inspected: {r['Inspected']}"
-                c.drawString(2*cm, y, line[:200])
-                y -= 0.6*cm
-                if y < 2*cm:
-                    c.showPage()
-                    y = height - 2*cm
-                    c.setFont("Helvetica", 9)
-            c.save()
-            pdf = buf.getvalue()
-            buf.close()
-            return Response(
-                pdf,
+            title = 'Asset Movement Report' if report_type == 'movement' else f"ICT Asset Report ({report_type.replace('_', ' ').title()})"
+            path = write_pdf(rows, PDF_COLUMNS.get(report_type, PDF_COLUMNS['all']), title)
+            return apply_validator(Response(
+                iter_file_chunks(path),
                 mimetype='application/pdf',
-                headers={'Content-Disposition': f'attachment; filename="{filename_base}.pdf"'}
-            )
+                headers={
+                    'Content-Disposition': f'attachment; filename="{filename_base}.pdf"',
+                    'Content-Length': str(os.path.getsize(path)),
+                }
+            ), validator, shared=True)
         except Exception:
-            printable = render_template('reports_print.html', assets=assets, report_type=report_type)
+            # The printable page is a different representation, so it must not carry the PDF's validator
+            app.logger.exception('PDF export of %s report failed, serving the printable page instead', report_type)
+            assets = iter_report_assets(report_type) if report_type != 'movement' else []
             return Response(
-                printable,
+                stream_with_context(stream_template('reports_print.html', assets=assets, report_type=report_type)),
                 mimetype='text/html'
             )
     log_action('export_report', details=f'{fmt}:{report_type}')
     return redirect(url_for('reports', type=report_type))
 
+API_FIELDS = {
+    Asset: [c.name for c in Asset.__table__.columns],
+    AssetActivity: [c.name for c in AssetActivity.__table__.columns],
+    AssetDocument: ['id', 'asset_id', 'timestamp', 'actor_user_id', 'doc_type', 'original_filename'],
+}
+
+def api_login_required(f):
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        if not current_user():
+            return jsonify({'error': 'authentication required'}), 401
+        return f(*args, **kwargs)
+    return wrapper
+
+def api_error(message, status=400):
+    return jsonify({'error': message}), status
+
+def api_fields(model):
+    allowed = API_FIELDS[model]
+    requested = [f.strip() for f in (request.args.get('fields') or '').split(',') if f.strip()]
+    if not requested:
+        return allowed
+    unknown = [f for f in requested if f not in allowed]
+    if unknown:
+        raise ValueError(f"unknown fields: {', '.join(unknown)}")
+    return ['id'] + [f for f in requested if f != 'id']
+
+def api_record(obj, fields):
+    record = {}
+    for f in fields:
+        value = getattr(obj, f)
+        record[f] = value.isoformat() if isinstance(value, (date, datetime)) else value
+    if isinstance(obj, AssetDocument):
+        record['download_url'] = url_for('download_asset_document', asset_id=obj.asset_id, doc_id=obj.id)
+    return record
+
+def api_response(payload):
+    resp = jsonify(payload)
+    resp.headers['Cache-Control'] = 'private, no-cache'
+    resp.add_etag()
+    return resp.make_conditional(request)
+
+def api_page(q, model):
+    try:
+        fields = api_fields(model)
+    except ValueError as e:
+        return api_error(str(e))
+    try:
+        limit = min(max(int(request.args.get('limit') or API_PAGE_SIZE), 1), API_MAX_PAGE_SIZE)
+    except ValueError:
+        return api_error('limit must be an integer')
+    after = parse_cursor(request.args.get('after'))
+    loaded = fields + ['asset_id'] if model is AssetDocument else fields
+    q = q.options(load_only(*[getattr(model, f) for f in loaded]))
+    if after:
+        q = q.filter(model.id > after)
+    rows = q.order_by(model.id).limit(limit + 1).all()
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = rows[-1].id if rows and has_next else None
+    args = {k: v for k, v in request.args.items() if k != 'after' and k not in request.view_args}
+    args.update(request.view_args, after=next_cursor)
+    return api_response({
+        'data': [api_record(r, fields) for r in rows],
+        'next_cursor': next_cursor,
+        'next_url': url_for(request.endpoint, **args) if next_cursor else None,
+    })
+
+def api_scoped_asset(asset_id):
+    return filter_by_user_location(Asset.query.filter(Asset.id == asset_id)).with_entities(Asset.id).first()
+
+@app.route('/api/v1/assets')
+@api_login_required
+def api_assets():
+    report_type = request.args.get('type', 'all')
+    if report_type == 'movement':
+        return api_error('use /api/v1/activities for movement history')
+    return api_page(report_assets_query(report_type), Asset)
+
+@app.route('/api/v1/assets/<int:id>')
+@api_login_required
+def api_asset(id):
+    try:
+        fields = api_fields(Asset)
+    except ValueError as e:
+        return api_error(str(e))
+    asset = filter_by_user_location(Asset.query.filter(Asset.id == id)).first()
+    if not asset:
+        return api_error('asset not found', 404)
+    return api_response({'data': api_record(asset, fields)})
+
+@app.route('/api/v1/assets/<int:id>/activities')
+@api_login_required
+def api_asset_activities(id):
+    if not api_scoped_asset(id):
+        return api_error('asset not found', 404)
+    return api_page(AssetActivity.query.filter(AssetActivity.asset_id == id), AssetActivity)
+
+@app.route('/api/v1/assets/<int:id>/documents')
+@api_login_required
+def api_asset_documents(id):
+    if not api_scoped_asset(id):
+        return api_error('asset not found', 404)
+    return api_page(AssetDocument.query.filter(AssetDocument.asset_id == id), AssetDocument)
+
+@app.route('/api/v1/activities')
+@api_login_required
+def api_activities():
+    q = filter_by_user_location(AssetActivity.query.join(Asset, Asset.id == AssetActivity.asset_id))
+    action = (request.args.get('action') or '').strip()
+    field = (request.args.get('field') or '').strip()
+    start_date_str = (request.args.get('start_date') or '').strip()
+    end_date_str = (request.args.get('end_date') or '').strip()
+    if action:
+        q = q.filter(AssetActivity.action == action)
+    if field:
+        q = q.filter(AssetActivity.field == field)
+    if start_date_str:
+        try:
+            q = q.filter(AssetActivity.timestamp >= datetime.strptime(start_date_str, '%Y-%m-%d'))
+        except Exception:
+            pass
+    if end_date_str:
+        try:
+            q = q.filter(AssetActivity.timestamp < datetime.strptime(end_date_str, '%Y-%m-%d') + timedelta(days=1))
+        except Exception:
+            pass
+    return api_page(q, AssetActivity)
+
+@app.route('/api/v1/documents')
+@api_login_required
+def api_documents():
+    q = filter_by_user_location(AssetDocument.query.join(Asset, Asset.id == AssetDocument.asset_id))
+    doc_type = (request.args.get('doc_type') or '').strip()
+    if doc_type:
+        q = q.filter(AssetDocument.doc_type == doc_type)
+    return api_page(q, AssetDocument)
+
+def import_documents(fileobj):
+    # Delivery notes for purchased rows come in a zip; rows name them by file name
+    try:
+        archive = zipfile.ZipFile(fileobj)
+    except zipfile.BadZipFile:
+        raise ValueError('Documents file is not a zip archive')
+    return {Path(info.filename).name: info for info in archive.infolist() if not info.is_dir()}, archive
+
+def validate_import_row(raw, user, documents=None):
+    row = {c: (raw.get(c) or '').strip() for c in IMPORT_COLUMNS}
+    row['category'] = row['category'] or 'ICT'
+    if row['status'] == 'Lost':
+        row['status'] = 'Lost / Stolen'
+    if user and user.role != 'IT':
+        if user.province and user.province != 'Head Office':
+            row['province'] = user.province
+        if user.role == 'AdminDistrict' and user.district:
+            row['district'] = user.district
+    errors = []
+    if not row['name']:
+        errors.append('Asset name is required')
+    if not row['type']:
+        errors.append('Asset type is required')
+    if not row['serial_number']:
+        errors.append('Serial number is required')
+    purchase_date = None
+    if not row['purchase_date']:
+        errors.append('Purchase date is required')
+    else:
+        try:
+            purchase_date = datetime.strptime(row['purchase_date'], '%Y-%m-%d').date()
+        except ValueError:
+            errors.append('Purchase date must be YYYY-MM-DD')
+    if row['acquisition_type'] not in ['Purchased', 'Donated']:
+        errors.append('Acquisition type must be Purchased or Donated')
+    if row['acquisition_type'] == 'Purchased':
+        if not row['supplier']:
+            errors.append('Supplier is required for purchased assets')
+        if not row['delivery_note']:
+            errors.append('Delivery note document is required for purchased assets')
+        elif not documents or row['delivery_note'] not in documents:
+            errors.append(f"Delivery note {row['delivery_note']} is not in the documents archive")
+    if row['acquisition_type'] == 'Donated' and not row['donor_name']:
+        errors.append('Donor Name is required for donated assets')
+    if row['status'] not in ALLOWED_ASSET_STATUSES:
+        errors.append('Invalid status')
+    elif row['status'] not in IMPORT_STATUSES:
+        errors.append(f"Status {row['status']} cannot be imported; add the asset individually")
+    if row['status'] == 'In Use' and not row['assigned_to']:
+        errors.append('Assigned To is required when status is In Use')
+    if row['status'] != 'In Use':
+        row['assigned_to'] = ''
+    if not row['province']:
+        errors.append('Province is required')
+    elif row['province'] not in PROVINCE_DISTRICTS:
+        errors.append(f"Unknown province {row['province']}")
+    elif row['province'] != 'Head Office':
+        if not row['district']:
+            errors.append('District is required for the selected province')
+        elif row['district'] not in PROVINCE_DISTRICTS[row['province']]:
+            errors.append(f"District {row['district']} is not in {row['province']}")
+    if errors:
+        return None, errors
+    values = {
+        'name': row['name'],
+        'category': row['category'],
+        'type': row['type'],
+        'serial_number': row['serial_number'],
+        'purchase_date': purchase_date,
+        'acquisition_type': row['acquisition_type'],
+        'supplier': row['supplier'] or None,
+        'donor_name': row['donor_name'] or None,
+        'status': row['status'],
+        'assigned_to': row['assigned_to'] or None,
+        'province': row['province'],
+        'district': row['district'] or None,
+        'general_comments': row['general_comments'] or None,
+        'capture_date': datetime.utcnow().date(),
+        'inspected_by_ict': False,
+        'created_by_user_id': user.id if user else None,
+        'eol_date': compute_eol_date(row['type'], purchase_date),
+        'routine_service_due_date': compute_routine_service_due_date(row['type'], purchase_date, None),
+    }
+    if row['acquisition_type'] == 'Purchased':
+        values['delivery_note'] = row['delivery_note']
+    return values, []
+
+def import_asset_batch(batch, user, seen_serials, dry_run=False, documents=None):
+    errors = []
+    serials = [values['serial_number'] for _, values in batch]
+    existing = {r[0] for r in db.session.query(Asset.serial_number).filter(Asset.serial_number.in_(serials))}
+    accepted = []
+    for line, values in batch:
+        serial = values['serial_number']
+        if serial in seen_serials:
+            errors.append((line, serial, ['Serial number repeated in file']))
+        elif serial in existing:
+            errors.append((line, serial, ['Serial number already exists']))
+        else:
+            seen_serials.add(serial)
+            accepted.append((line, values))
+    if not accepted or dry_run:
+        return len(accepted), errors
+    try:
+        insert_imported_assets([values for _, values in accepted], user, documents)
+    except Exception as e:
+        db.session.rollback()
+        for line, values in accepted:
+            seen_serials.discard(values['serial_number'])
+            errors.append((line, values['serial_number'], [f'Batch not saved: {e}']))
+        return 0, errors
+    for _, values in accepted:
+        autocomplete_index.update(None, autocomplete_key(SimpleNamespace(**values)))
+    return len(accepted), errors
+
+def insert_imported_assets(accepted, user, documents=None):
+    columns = Asset.__table__.columns
+    db.session.execute(Asset.__table__.insert(), [{k: v for k, v in values.items() if k in columns} for values in accepted])
+    ids = dict(db.session.query(Asset.serial_number, Asset.id).filter(Asset.serial_number.in_([v['serial_number'] for v in accepted])))
+    now = datetime.utcnow()
+    actor_id = user.id if user else None
+    db.session.execute(AssetActivity.__table__.insert(), [
+        {'asset_id': ids[v['serial_number']], 'timestamp': now, 'actor_user_id': actor_id, 'action': 'create', 'details': 'bulk import'}
+        for v in accepted
+    ])
+    notes = [v for v in accepted if v.get('delivery_note')]
+    saved = []
+    if notes:
+        index, archive = documents
+        uploads_dir = Path(app.config['UPLOAD_FOLDER'])
+        uploads_dir.mkdir(parents=True, exist_ok=True)
+        ts = now.strftime('%Y%m%d%H%M%S%f')
+        doc_rows = []
+        try:
+            for v in notes:
+                asset_id = ids[v['serial_number']]
+                safe_name = secure_filename(v['delivery_note'])
+                stored = f"{asset_id}_{ts}_{safe_name}" if safe_name else f"{asset_id}_{ts}"
+                with archive.open(index[v['delivery_note']]) as src, open(uploads_dir / stored, 'wb') as dst:
+                    saved.append(uploads_dir / stored)
+                    shutil.copyfileobj(src, dst)
+                doc_rows.append({'asset_id': asset_id, 'timestamp': now, 'actor_user_id': actor_id, 'doc_type': 'specification', 'original_filename': v['delivery_note'], 'stored_filename': stored})
+            db.session.execute(AssetDocument.__table__.insert(), doc_rows)
+            db.session.execute(AssetActivity.__table__.insert(), [
+                {'asset_id': r['asset_id'], 'timestamp': now, 'actor_user_id': actor_id, 'action': 'upload_document', 'field': 'specification', 'old_value': '', 'new_value': r['original_filename']}
+                for r in doc_rows
+            ])
+        except Exception:
+            for path in saved:
+                path.unlink(missing_ok=True)
+            raise
+    comments = [
+        {'asset_id': ids[v['serial_number']], 'user_id': actor_id, 'content': v['general_comments'], 'timestamp': now}
+        for v in accepted if v['general_comments']
+    ]
+    if comments:
+        db.session.execute(AssetComment.__table__.insert(), comments)
+    summary_deltas = {}
+    for v in accepted:
+        key = inventory_summary_key(SimpleNamespace(**v))
+        summary_deltas[key] = summary_deltas.get(key, 0) + 1
+    for key, n in summary_deltas.items():
+        bump_inventory_summary(key, n)
+    try:
+        sync_asset_search(ids.values())
+        bump_data_version({v['province'] for v in accepted})
+        db.session.commit()
+    except Exception:
+        for path in saved:
+            path.unlink(missing_ok=True)
+        raise
+    return ids
+
+def import_assets_csv(stream, user, dry_run=False, batch_size=IMPORT_BATCH_SIZE, documents=None):
+    reader = csv.DictReader(stream)
+    missing = [c for c in ['name', 'type', 'serial_number', 'purchase_date', 'acquisition_type', 'status', 'province'] if c not in (reader.fieldnames or [])]
+    if missing:
+        return {'created': 0, 'errors': [(1, '', [f"Missing column(s): {', '.join(missing)}"])], 'rows': 0}
+    created = 0
+    rows = 0
+    errors = []
+    seen_serials = set()
+    batch = []
+    for raw in reader:
+        rows += 1
+        line = reader.line_num
+        values, row_errors = validate_import_row(raw, user, documents[0] if documents else None)
+        if row_errors:
+            errors.append((line, (raw.get('serial_number') or '').strip(), row_errors))
+            continue
+        batch.append((line, values))
+        if len(batch) >= batch_size:
+            n, batch_errors = import_asset_batch(batch, user, seen_serials, dry_run, documents)
+            created += n
+            errors.extend(batch_errors)
+            batch = []
+    if batch:
+        n, batch_errors = import_asset_batch(batch, user, seen_serials, dry_run, documents)
+        created += n
+        errors.extend(batch_errors)
+    errors.sort(key=lambda e: e[0])
+    return {'created': created, 'errors': errors, 'rows': rows}
+
+@app.route('/import', methods=['GET', 'POST'])
+@login_required
+def import_assets():
+    if not has_asset_edit_rights():
+        flash('Access denied', 'danger')
+        return redirect(url_for('index'))
+    result = None
+    if request.method == 'POST':
+        upload = request.files.get('file')
+        documents_upload = request.files.get('documents')
+        dry_run = request.form.get('dry_run') == 'on'
+        if not upload or not upload.filename:
+            flash('Choose a CSV file to import', 'danger')
+            return render_template('import_assets.html', result=None, columns=IMPORT_COLUMNS)
+        documents = None
+        try:
+            if documents_upload and documents_upload.filename:
+                documents = import_documents(documents_upload.stream)
+            result = import_assets_csv(io.TextIOWrapper(upload.stream, encoding='utf-8-sig', newline=''), current_user(), dry_run, documents=documents)
+        except ValueError as e:
+            flash(str(e), 'danger')
+            return render_template('import_assets.html', result=None, columns=IMPORT_COLUMNS)
+        except (UnicodeDecodeError, csv.Error) as e:
+            db.session.rollback()
+            flash(f'Could not read CSV file: {e}', 'danger')
+            return render_template('import_assets.html', result=None, columns=IMPORT_COLUMNS)
+        finally:
+            if documents:
+                documents[1].close()
+        result['dry_run'] = dry_run
+        if not dry_run:
+            log_action('bulk_import', 'Asset', None, f"file={upload.filename},rows={result['rows']},created={result['created']},errors={len(result['errors'])}")
+        flash(f"{'Validated' if dry_run else 'Imported'} {result['created']} of {result['rows']} rows", 'success' if not result['errors'] else 'warning')
+    return render_template('import_assets.html', result=result, columns=IMPORT_COLUMNS)
+
+@app.route('/import/template')
+@login_required
+def import_template():
+    return Response(
+        ','.join(IMPORT_COLUMNS) + '\r\n',
+        mimetype='text/csv',
+        headers={'Content-Disposition': 'attachment; filename="asset_import_template.csv"'}
+    )
+
+@app.cli.command('import-assets')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--user', 'username', required=True, help='Username recorded as the creator; their location scope applies.')
+@click.option('--documents', 'documents_path', type=click.Path(exists=True, dir_okay=False), help='Zip of the delivery notes named in the delivery_note column.')
+@click.option('--dry-run', is_flag=True, help='Validate only, do not insert.')
+def import_assets_command(path, username, documents_path, dry_run):
+    user = User.query.filter_by(username=username).first()
+    if not user:
+        raise click.ClickException(f'Unknown user {username}')
+    documents = None
+    try:
+        if documents_path:
+            documents = import_documents(documents_path)
+        with open(path, encoding='utf-8-sig', newline='') as f:
+            result = import_assets_csv(f, user, dry_run, documents=documents)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    finally:
+        if documents:
+            documents[1].close()
+    if not dry_run:
+        db.session.add(AuditLog(actor_user_id=user.id, action='bulk_import', entity_type='Asset', details=f"file={Path(path).name},rows={result['rows']},created={result['created']},errors={len(result['errors'])}"))
+        db.session.commit()
+    print(f"{'Validated' if dry_run else 'Imported'} {result['created']} of {result['rows']} rows, {len(result['errors'])} errors")
+    if result['errors']:
+        writer = csv.writer(sys.stdout)
+        writer.writerow(['line', 'serial_number', 'errors'])
+        for line, serial, errs in result['errors']:
+            writer.writerow([line, serial, '; '.join(errs)])
+
+def bulk_edit_assets(ids, action, params, inspection_file=None):
+    u = current_user()
+    if action not in BULK_EDIT_ACTIONS:
+        raise ValueError('Unknown bulk action')
+    ids = sorted({int(i) for i in ids})
+    if not ids:
+        raise ValueError('No assets selected')
+    if len(ids) > BULK_EDIT_LIMIT:
+        raise ValueError(f'At most {BULK_EDIT_LIMIT} assets can be changed at once')
+    note = (params.get('note') or '').strip()
+    values = {}
+    if action == 'status':
+        new_status = (params.get('status') or '').strip()
+        if new_status not in BULK_EDIT_STATUSES:
+            raise ValueError('Bulk status must be one of ' + ', '.join(BULK_EDIT_STATUSES))
+        if new_status == 'Archived' and u.role == 'AdminDistrict':
+            raise ValueError('You have no right to archive assets')
+        assigned_to = (params.get('assigned_to') or '').strip() or None
+        if new_status == 'In Use' and not assigned_to:
+            raise ValueError('Assigned To is required when status is In Use')
+        values = {'status': new_status, 'assigned_to': assigned_to if new_status == 'In Use' else None}
+    elif action == 'reassign':
+        assigned_to = (params.get('assigned_to') or '').strip()
+        province = (params.get('province') or '').strip()
+        district = (params.get('district') or '').strip()
+        if assigned_to:
+            values['assigned_to'] = assigned_to
+        if province or district:
+            if u.role == 'AdminDistrict':
+                raise ValueError('You have no right to relocate an asset to another district')
+            if u.role != 'IT' and u.province and u.province != 'Head Office':
+                province = u.province
+            if province not in PROVINCE_DISTRICTS:
+                raise ValueError('Select a valid province')
+            if province != 'Head Office' and district not in PROVINCE_DISTRICTS[province]:
+                raise ValueError(f'Select a district in {province}')
+            values['province'] = province
+            values['district'] = district if province != 'Head Office' else None
+        if not values:
+            raise ValueError('Enter an assignee or a new location')
+    elif action == 'service':
+        try:
+            service_date = datetime.strptime((params.get('service_date') or '').strip(), '%Y-%m-%d').date()
+        except ValueError:
+            raise ValueError('Service date is required (YYYY-MM-DD)')
+        values = {
+            'last_service_date': service_date,
+            'routine_service_due_date': add_months(service_date, ROUTINE_SERVICE_INTERVAL_MONTHS),
+        }
+    elif action == 'inspect':
+        if u.role != 'IT':
+            raise ValueError('Only IT can record inspections')
+        try:
+            inspection_date = datetime.strptime((params.get('inspection_date') or '').strip(), '%Y-%m-%d').date()
+        except ValueError:
+            raise ValueError('Inspection date is required (YYYY-MM-DD)')
+        if not inspection_file or not inspection_file.filename:
+            raise ValueError('Inspection document is required when marking inspected')
+        values = {'inspected_by_ict': True, 'inspection_date': inspection_date}
+
+    columns = [Asset.id, Asset.type, Asset.category, Asset.status, Asset.assigned_to, Asset.province, Asset.district,
+               Asset.supplier, Asset.donor_name, Asset.inspected_by_ict, Asset.inspection_date, Asset.last_service_date]
+    rows = {r.id: r for r in filter_by_user_location(Asset.query.filter(Asset.id.in_(ids))).with_entities(*columns)}
+    skipped = [(i, 'Not found or outside your location') for i in ids if i not in rows]
+    eligible = []
+    transition_notes = {}
+    for r in rows.values():
+        status = normalize_asset_status(r.status)
+        reason = None
+        if status in LOCKED_ASSET_STATUSES:
+            reason = 'Archived or Auctioned assets cannot be changed'
+        elif action == 'status':
+            transition_notes[r.id] = status_change_note(status, values['status'])
+            if status == values['status'] and (r.assigned_to or None) == values['assigned_to']:
+                reason = f'Already {status}'
+            elif transition_notes[r.id] and not note:
+                reason = transition_notes[r.id][1]
+        elif action == 'reassign' and 'assigned_to' in values and status != 'In Use':
+            reason = 'Assigned To can only be set on assets that are In Use'
+        elif action == 'service' and r.type not in ROUTINE_SERVICE_TYPES:
+            reason = 'Routine service does not apply to this asset type'
+        elif action == 'inspect' and (r.inspected_by_ict or r.inspection_date):
+            reason = 'Already inspected'
+        if reason:
+            skipped.append((r.id, reason))
+        else:
+            eligible.append(r)
+    if not eligible:
+        return [], sorted(skipped)
+
+    eligible_ids = [r.id for r in eligible]
+    actor_id = u.id if u else None
+    now = datetime.utcnow()
+    field_actions = {
+        'province': 'update', 'district': 'update', 'assigned_to': 'update',
+        'status': 'archive' if values.get('status') == 'Archived' else 'status',
+        'inspected_by_ict': 'inspection', 'inspection_date': 'inspection',
+        'last_service_date': 'routine_service',
+    }
+    activities = []
+    comments = []
+    documents = []
+    summary_deltas = {}
+    autocomplete_changes = []
+    for r in eligible:
+        new = {c.key: values.get(c.key, getattr(r, c.key)) for c in columns}
+        for field, new_value in values.items():
+            if field not in field_actions:
+                continue
+            old_value, new_value = activity_value(field, getattr(r, field)), activity_value(field, new_value)
+            if old_value != new_value:
+                activities.append({'asset_id': r.id, 'timestamp': now, 'actor_user_id': actor_id, 'action': field_actions[field],
+                                   'field': field, 'old_value': old_value, 'new_value': new_value, 'details': 'bulk edit'})
+        if transition_notes.get(r.id):
+            activities.append({'asset_id': r.id, 'timestamp': now, 'actor_user_id': actor_id, 'action': transition_notes[r.id][0],
+                               'field': 'note', 'old_value': '', 'new_value': note, 'details': 'bulk edit'})
+        if action == 'service' and note:
+            comments.append({'asset_id': r.id, 'user_id': actor_id, 'timestamp': now, 'content': f"Routine Service ({values['last_service_date'].isoformat()}): {note}"})
+        if action == 'inspect':
+            documents.append({'asset_id': r.id, 'timestamp': now, 'actor_user_id': actor_id, 'doc_type': 'inspection', 'original_filename': inspection_file.filename})
+            activities.append({'asset_id': r.id, 'timestamp': now, 'actor_user_id': actor_id, 'action': 'upload_document',
+                               'field': 'inspection', 'old_value': '', 'new_value': inspection_file.filename, 'details': 'bulk edit'})
+        old_key, new_key = inventory_summary_key(r), inventory_summary_key(SimpleNamespace(**new))
+        if old_key != new_key:
+            summary_deltas[old_key] = summary_deltas.get(old_key, 0) - 1
+            summary_deltas[new_key] = summary_deltas.get(new_key, 0) + 1
+        autocomplete_changes.append((autocomplete_key(r), autocomplete_key(SimpleNamespace(**new))))
+
+    stored_path = None
+    if documents:
+        uploads_dir = Path(app.config['UPLOAD_FOLDER'])
+        uploads_dir.mkdir(parents=True, exist_ok=True)
+        safe_name = secure_filename(inspection_file.filename)
+        ts = now.strftime('%Y%m%d%H%M%S%f')
+        stored = f"bulk_{ts}_{safe_name}" if safe_name else f"bulk_{ts}"
+        stored_path = uploads_dir / stored
+        inspection_file.save(str(stored_path))
+        for d in documents:
+            d['stored_filename'] = stored
+    try:
+        db.session.execute(update(Asset).where(Asset.id.in_(eligible_ids)).values(**values).execution_options(synchronize_session=False))
+        if activities:
+            db.session.execute(AssetActivity.__table__.insert(), activities)
+        if comments:
+            db.session.execute(AssetComment.__table__.insert(), comments)
+        if documents:
+            db.session.execute(AssetDocument.__table__.insert(), documents)
+        for key, delta in summary_deltas.items():
+            if delta:
+                bump_inventory_summary(key, delta)
+        if action in ('status', 'reassign', 'service'):
+            sync_asset_search(eligible_ids)
+        bump_data_version([r.province for r in eligible] + [values.get('province')])
+        log_action('bulk_edit', 'Asset', None, f"{action}: {len(eligible_ids)} assets ({', '.join(f'{k}={activity_value(k, v)}' for k, v in values.items())})", commit=False)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        if stored_path:
+            stored_path.unlink(missing_ok=True)
+        raise
+    for old_key, new_key in autocomplete_changes:
+        autocomplete_index.update(old_key, new_key)
+    return eligible_ids, sorted(skipped)
+
+def bulk_edit_return_url(back):
+    # Only ever send the user back to this page with its own filters, never to a posted URL
+    args = {}
+    parts = urlsplit(back or '')
+    if not parts.scheme and not parts.netloc and parts.path == url_for('bulk_edit'):
+        args = {k: v for k, v in parse_qsl(parts.query) if v and (k == 'type' or k in REPORT_FILTER_ARGS)}
+    return url_for('bulk_edit', **args)
+
+@app.route('/bulk', methods=['GET', 'POST'])
+@login_required
+def bulk_edit():
+    if not has_asset_edit_rights():
+        flash('Access denied', 'danger')
+        return redirect(url_for('index'))
+    if request.method == 'POST':
+        back = bulk_edit_return_url(request.form.get('back'))
+        try:
+            updated, skipped = bulk_edit_assets(request.form.getlist('ids'), request.form.get('action'), request.form, request.files.get('inspection_document'))
+        except ValueError as e:
+            flash(str(e), 'danger')
+            return redirect(back)
+        except Exception as e:
+            log_action('bulk_edit_error', 'Asset', None, str(e))
+            flash(f'Error updating assets: {e}', 'danger')
+            return redirect(back)
+        flash(f'{len(updated)} assets updated', 'success' if updated else 'warning')
+        reasons = {}
+        for _, reason in skipped:
+            reasons[reason] = reasons.get(reason, 0) + 1
+        for reason, n in reasons.items():
+            flash(f'{n} skipped: {reason}', 'warning')
+        return redirect(back)
+    report_type = request.args.get('type', 'all')
+    if report_type == 'movement':
+        report_type = 'all'
+    assets = report_assets_query(report_type).order_by(Asset.id).limit(BULK_EDIT_LIMIT + 1).all()
+    return render_template(
+        'bulk_edit.html',
+        assets=assets[:BULK_EDIT_LIMIT],
+        truncated=len(assets) > BULK_EDIT_LIMIT,
+        report_type=report_type,
+        statuses=BULK_EDIT_STATUSES,
+        provinces=PROVINCE_DISTRICTS,
+        limit=BULK_EDIT_LIMIT,
+    )
+
+@app.route('/api/v1/assets/bulk', methods=['POST'])
+@api_login_required
+def api_bulk_edit():
+    if not has_asset_edit_rights():
+        return api_error('access denied', 403)
+    payload = request.get_json(silent=True) or {}
+    try:
+        updated, skipped = bulk_edit_assets(payload.get('ids') or [], payload.get('action'), payload)
+    except (ValueError, TypeError) as e:
+        return api_error(str(e))
+    return jsonify({'updated': updated, 'skipped': [{'id': i, 'reason': reason} for i, reason in skipped]})
+
 @app.route('/login', methods=['GET', 'POST'])
 def login():
     if request.method == 'POST':
@@ -1526,6 +3422,7 @@ def change_password():
             return render_template('change_password.html')
         u.password_hash = generate_password_hash(new_pw)
         db.session.commit()
+        invalidate_user(u.id)
         log_action('password_changed_self', 'User', u.id)
         flash('Password updated successfully', 'success')
         return redirect(url_for('index'))
@@ -1597,10 +3494,448 @@ class PasswordResetToken(db.Model):
     expires_at = db.Column(db.DateTime, nullable=False)
     used = db.Column(db.Boolean, default=False, nullable=False)
 
+def query_plan_samples():
+    today = datetime.now().date()
+    return [
+        ('Scope: province/district', Asset.query.filter(Asset.province == 'Harare', Asset.district == 'Harare District')),
+        ('Dashboard ICT tab page', Asset.query.filter(active_asset_filter(), Asset.category == 'ICT').order_by(Asset.id).limit(DASHBOARD_PAGE_SIZE)),
+        ('Report: status filter', Asset.query.filter(Asset.status == 'In Use')),
+        ('Report: archived/auctioned', Asset.query.filter(Asset.status.in_(LOCKED_ASSET_STATUSES))),
+        ('Report: computers by type', Asset.query.filter(Asset.type.in_(['Laptop', 'Desktop', 'All-in-One']))),
+        ('Report: supplier', Asset.query.filter(Asset.supplier == 'Supplier')),
+        ('Report: assigned to', Asset.query.filter(Asset.assigned_to == 'Person')),
+        ('Report: acquisition type', Asset.query.filter(Asset.acquisition_type == 'Donated')),
+        ('Report: uninspected', Asset.query.filter(Asset.inspected_by_ict == False)),
+        ('Report: purchase date range', Asset.query.filter(Asset.purchase_date >= date(today.year, 1, 1), Asset.purchase_date <= today)),
+        ('Report: past EOL', Asset.query.filter(Asset.eol_date <= today)),
+        ('Movement report', AssetActivity.query.filter(AssetActivity.field.in_(['province', 'district', 'assigned_to', 'status'])).order_by(AssetActivity.timestamp.desc()).limit(500)),
+        ('Audit log latest', AuditLog.query.order_by(AuditLog.timestamp.desc()).limit(50)),
+        ('Audit log by action', AuditLog.query.filter(AuditLog.action == 'login_failed').order_by(AuditLog.timestamp.desc())),
+        ('Audit log by actor', AuditLog.query.filter(AuditLog.actor_user_id == 1).order_by(AuditLog.timestamp.desc())),
+        ('Audit log by entity', AuditLog.query.filter(AuditLog.entity_type == 'Asset', AuditLog.entity_id == 1).order_by(AuditLog.timestamp.desc())),
+        ('Audit log date range page', AuditLog.query.filter(AuditLog.timestamp >= datetime(today.year, 1, 1), AuditLog.timestamp < datetime(today.year, today.month, today.day)).order_by(AuditLog.timestamp.desc(), AuditLog.id.desc()).limit(AUDIT_PAGE_SIZE)),
+    ]
+
+def collect_query_plans():
+    engine_name = db.engine.name
+    prefix = 'EXPLAIN QUERY PLAN ' if engine_name == 'sqlite' else 'EXPLAIN '
+    plans = []
+    for label, q in query_plan_samples():
+        sql = str(q.statement.compile(dialect=db.engine.dialect, compile_kwargs={'literal_binds': True}))
+        try:
+            rows = db.session.execute(text(prefix + sql)).fetchall()
+            plan = [str(r[-1]) for r in rows]
+        except Exception as e:
+            db.session.rollback()
+            plan = [f'(plan unavailable: {e})']
+        plans.append((label, plan))
+    db.session.rollback()
+    return plans
+
+def missing_indexes():
+    missing = []
+    inspector = db.inspect(db.engine)
+    for model in [Asset, AuditLog, AuditCounter, AssetActivity, AssetDocument, AssetComment]:
+        existing = {i['name'] for i in inspector.get_indexes(model.__tablename__)}
+        missing.extend(i for i in sorted(model.__table__.indexes, key=lambda i: i.name) if i.name not in existing)
+    return missing
+
+def format_query_plans(before, after):
+    lines = []
+    for (label, before_plan), (_, after_plan) in zip(before, after):
+        lines.append(label)
+        lines.extend(f'  before: {p}' for p in before_plan)
+        lines.extend(f'  after:  {p}' for p in after_plan)
+    return '\n'.join(lines)
+
+def migrate_indexes():
+    missing = missing_indexes()
+    before = collect_query_plans()
+    for index in missing:
+        index.create(bind=db.engine)
+    after = collect_query_plans()
+    created = [i.name for i in missing]
+    report = f"Indexes created: {', '.join(created) if created else 'none'}\n" + format_query_plans(before, after)
+    if created:
+        report_path = Path(app.instance_path) / 'index_migration_report.txt'
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(f"{datetime.now().isoformat()} ({db.engine.name})\n{report}\n")
+    return created, report
+
+@app.cli.command('migrate-indexes')
+def migrate_indexes_command():
+    report_path = Path(app.instance_path) / 'index_migration_report.txt'
+    created, report = migrate_indexes()
+    if not created and report_path.exists():
+        print(f"Last migration report ({report_path}):")
+        print(report_path.read_text())
+    print(report)
+
+def storage_profile():
+    engine = db.engine
+    pool = engine.pool
+    stats = {'class': type(pool).__name__}
+    for name in ['size', 'checkedin', 'checkedout', 'overflow']:
+        fn = getattr(pool, name, None)
+        if callable(fn):
+            stats[name] = fn()
+    settings = {}
+    if engine.name == 'sqlite':
+        with engine.connect() as conn:
+            for pragma in ['journal_mode', 'synchronous', 'cache_size', 'mmap_size', 'busy_timeout']:
+                settings[pragma] = conn.exec_driver_sql(f'PRAGMA {pragma}').scalar()
+        if isinstance(settings['synchronous'], int) and settings['synchronous'] < len(SQLITE_SYNCHRONOUS_LEVELS):
+            settings['synchronous'] = SQLITE_SYNCHRONOUS_LEVELS[settings['synchronous']]
+    else:
+        settings['pool_pre_ping'] = app.config['DB_POOL_PRE_PING']
+        settings['pool_recycle'] = app.config['DB_POOL_RECYCLE']
+        if engine.name == 'postgresql':
+            with engine.connect() as conn:
+                settings['statement_timeout'] = conn.exec_driver_sql('SHOW statement_timeout').scalar()
+    settings['pool_timeout'] = app.config['DB_POOL_TIMEOUT']
+    return {'backend': engine.name, 'settings': settings, 'pool': stats}
+
+@app.cli.command('storage-profile')
+def storage_profile_command():
+    profile = storage_profile()
+    print(f"Backend: {profile['backend']}")
+    for k, v in profile['settings'].items():
+        print(f"  {k}: {v}")
+    print('Pool: ' + ', '.join(f'{k}={v}' for k, v in profile['pool'].items()))
+
+LOGICAL_DUMP_FORMAT = 'inventory-logical-dump'
+LOGICAL_DUMP_VERSION = 1
+LOGICAL_DUMP_CHUNK_ROWS = 1000
+LOGICAL_DUMP_SKIP_TABLES = {'data_version', 'inventory_summary'}
+
+def logical_dump_tables():
+    return [t for t in db.metadata.sorted_tables if t.name not in LOGICAL_DUMP_SKIP_TABLES]
+
+def logical_dump_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+def logical_restore_converter(column):
+    if isinstance(column.type, db.DateTime):
+        return lambda v: datetime.fromisoformat(v) if isinstance(v, str) else v
+    if isinstance(column.type, db.Date):
+        return lambda v: date.fromisoformat(v[:10]) if isinstance(v, str) else v
+    if isinstance(column.type, db.Boolean):
+        return lambda v: bool(v) if v is not None else None
+    return None
+
+def iter_logical_dump(chunk_rows=LOGICAL_DUMP_CHUNK_ROWS):
+    tables = logical_dump_tables()
+    with db.engine.connect() as conn:
+        if conn.dialect.name == 'postgresql':
+            conn = conn.execution_options(isolation_level='REPEATABLE READ')
+            # DB_STATEMENT_TIMEOUT_MS is meant for requests, not for reading whole tables
+            conn.exec_driver_sql('SET LOCAL statement_timeout = 0')
+        elif conn.dialect.name == 'sqlite':
+            # pysqlite runs each SELECT in autocommit; one read transaction keeps every
+            # table on the same snapshot while writers carry on (WAL) or wait (rollback journal)
+            conn.exec_driver_sql('BEGIN')
+        yield json.dumps({
+            'format': LOGICAL_DUMP_FORMAT,
+            'version': LOGICAL_DUMP_VERSION,
+            'created': datetime.utcnow().isoformat(),
+            'backend': conn.dialect.name,
+            'tables': [t.name for t in tables],
+        }) + '\n'
+        for table in tables:
+            columns = [c.name for c in table.columns]
+            yield json.dumps({'table': table.name, 'columns': columns}) + '\n'
+            count = 0
+            result = conn.execution_options(stream_results=True, yield_per=chunk_rows).execute(
+                table.select().order_by(*table.primary_key.columns)
+            )
+            for rows in result.partitions():
+                count += len(rows)
+                yield json.dumps({'rows': [[logical_dump_value(v) for v in row] for row in rows]}) + '\n'
+            yield json.dumps({'end': table.name, 'count': count}) + '\n'
+
+def iter_gzip(chunks):
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode='wb') as out:
+        for chunk in chunks:
+            out.write(chunk.encode())
+            if buf.tell() >= 64 * 1024:
+                yield buf.getvalue()
+                buf.seek(0)
+                buf.truncate()
+    yield buf.getvalue()
+
+def write_logical_dump(path, chunk_rows=LOGICAL_DUMP_CHUNK_ROWS):
+    path = Path(path)
+    part = path.with_name(path.name + '.part')
+    try:
+        with gzip.open(part, 'wt', encoding='utf-8') as out:
+            for line in iter_logical_dump(chunk_rows):
+                out.write(line)
+        os.replace(part, path)
+    finally:
+        try:
+            os.remove(part)
+        except OSError:
+            pass
+    return path
+
+def iter_logical_dump_items(stream):
+    try:
+        for line in io.TextIOWrapper(gzip.GzipFile(fileobj=stream), encoding='utf-8'):
+            if line.strip():
+                yield json.loads(line)
+    except (EOFError, gzip.BadGzipFile, zlib.error) as e:
+        raise ValueError(f'Dump is truncated or not gzip-compressed: {e}')
+
+def restore_logical_dump(stream, chunk_rows=LOGICAL_DUMP_CHUNK_ROWS):
+    lines = iter_logical_dump_items(stream)
+    header = next(lines, None)
+    if not header or header.get('format') != LOGICAL_DUMP_FORMAT:
+        raise ValueError('Not an inventory logical dump')
+    if header.get('version') != LOGICAL_DUMP_VERSION:
+        raise ValueError(f"Unsupported dump version {header.get('version')}")
+    tables = {t.name: t for t in logical_dump_tables()}
+    counts = {}
+    ended = set()
+    with db.engine.begin() as conn:
+        if conn.dialect.name == 'postgresql':
+            conn.exec_driver_sql('SET LOCAL statement_timeout = 0')
+        for table in reversed(list(tables.values())):
+            conn.execute(table.delete())
+        table = None
+        for item in lines:
+            if 'table' in item:
+                table = tables.get(item['table'])
+                columns = item['columns']
+                keep = [i for i, c in enumerate(columns) if table is not None and c in table.c]
+                converters = {i: logical_restore_converter(table.c[columns[i]]) for i in keep} if table is not None else {}
+                counts[item['table']] = 0
+            elif 'rows' in item:
+                if table is None:
+                    continue
+                batch = []
+                for row in item['rows']:
+                    record = {}
+                    for i in keep:
+                        v = row[i]
+                        record[columns[i]] = converters[i](v) if converters[i] and v is not None else v
+                    batch.append(record)
+                for i in range(0, len(batch), chunk_rows):
+                    conn.execute(table.insert(), batch[i:i + chunk_rows])
+                counts[table.name] += len(batch)
+            elif 'end' in item:
+                if table is not None and item.get('count') != counts[table.name]:
+                    raise ValueError(f"Dump is truncated: {table.name} has {counts[table.name]} of {item.get('count')} rows")
+                ended.add(item['end'])
+                table = None
+        missing = [name for name in header.get('tables') or [] if name not in ended]
+        if missing:
+            raise ValueError(f"Dump is truncated: no complete section for {', '.join(missing)}")
+        if conn.dialect.name == 'postgresql':
+            quote = conn.dialect.identifier_preparer.quote
+            for t in tables.values():
+                pk = list(t.primary_key.columns)
+                if len(pk) == 1 and isinstance(pk[0].type, db.Integer):
+                    conn.execute(
+                        text(f"SELECT setval(pg_get_serial_sequence(:table, :column), coalesce(max({quote(pk[0].name)}), 0) + 1, false) FROM {quote(t.name)}"),
+                        {'table': quote(t.name), 'column': pk[0].name},
+                    )
+    rebuild_inventory_summary()
+    bump_data_version()
+    db.session.commit()
+    reindex_asset_search(full=True)
+    user_cache.clear()
+    report_cache.clear()
+    autocomplete_index.loaded_at = None
+    return counts
+
+@app.cli.command('dump-db')
+@click.argument('path', type=click.Path(dir_okay=False))
+def dump_db_command(path):
+    path = write_logical_dump(path)
+    print(f"Logical dump written: {path} ({path.stat().st_size} bytes)")
+
+@app.cli.command('restore-db')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--yes', is_flag=True, help='Replace the current data without asking.')
+def restore_db_command(path, yes):
+    if not yes:
+        click.confirm('This replaces every row in the database. Continue?', abort=True)
+    with open(path, 'rb') as f:
+        try:
+            counts = restore_logical_dump(f)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+    for name, n in counts.items():
+        print(f"  {name}: {n}")
+    print(f"Restored {sum(counts.values())} rows into {len(counts)} tables")
+
+BACKUP_CHECK_SECONDS = 300
+BACKUP_LOCK_STALE_SECONDS = 3600
+
+def backup_dir():
+    return Path(app.config['BACKUP_FOLDER'])
+
+def sqlite_database_path():
+    url = db.engine.url
+    if url.get_backend_name() != 'sqlite' or not url.database or url.database == ':memory:':
+        return None
+    return Path(url.database)
+
+class BackupInProgress(RuntimeError):
+    pass
+
+@contextmanager
+def backup_lock(folder):
+    lock_path = folder / '.backup.lock'
+    try:
+        if time.time() - lock_path.stat().st_mtime > BACKUP_LOCK_STALE_SECONDS:
+            lock_path.unlink()
+    except OSError:
+        pass
+    try:
+        fd = os.open(str(lock_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        raise BackupInProgress('Another backup is already running')
+    try:
+        os.write(fd, str(os.getpid()).encode())
+        os.close(fd)
+        yield
+    finally:
+        try:
+            lock_path.unlink()
+        except OSError:
+            pass
+
+def list_backups():
+    folder = backup_dir()
+    if not folder.exists():
+        return []
+    files = [f for f in folder.glob('inventory_backup_*') if f.is_file() and not f.name.endswith('.part')]
+    files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+    return [{'name': f.name, 'size': f.stat().st_size, 'mtime': datetime.fromtimestamp(f.stat().st_mtime)} for f in files]
+
+def prune_backups(keep=None):
+    keep = app.config['BACKUP_RETENTION_COUNT'] if keep is None else keep
+    removed = 0
+    for b in list_backups()[keep:]:
+        try:
+            (backup_dir() / b['name']).unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+def backup_file_name():
+    return f"inventory_backup_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.db.gz"
+
+def database_backup_source():
+    source_path = sqlite_database_path()
+    if source_path is None:
+        raise RuntimeError('Online backups need a SQLite database file')
+    if not source_path.exists():
+        raise RuntimeError('Database file not found for backup')
+    return source_path
+
+def write_database_snapshot(source_path, target, name=None):
+    name = name or target.name
+    fd, snapshot = tempfile.mkstemp(dir=str(target.parent), prefix='.snapshot_', suffix='.db')
+    os.close(fd)
+    part = target.with_name(target.name + '.part')
+    try:
+        src = sqlite3.connect(str(source_path), timeout=app.config['SQLITE_BUSY_TIMEOUT_MS'] / 1000)
+        dst = sqlite3.connect(snapshot)
+        try:
+            src.backup(dst)
+        finally:
+            dst.close()
+            src.close()
+        with open(snapshot, 'rb') as f, open(part, 'wb') as raw, gzip.GzipFile(filename=name[:-3], mode='wb', fileobj=raw) as out:
+            shutil.copyfileobj(f, out, 1024 * 1024)
+        os.replace(part, target)
+    finally:
+        for leftover in (snapshot, part):
+            try:
+                os.remove(leftover)
+            except OSError:
+                pass
+    return target
+
+def create_database_backup(only_if_due=False):
+    source_path = database_backup_source()
+    folder = backup_dir()
+    folder.mkdir(parents=True, exist_ok=True)
+    with backup_lock(folder):
+        # Another worker may have finished one while this one waited for the lock
+        if only_if_due and not backup_due():
+            return None
+        target = write_database_snapshot(source_path, folder / backup_file_name())
+        prune_backups()
+    return target
+
+def backup_due():
+    latest = list_backups()[:1]
+    return not latest or (datetime.now() - latest[0]['mtime']).total_seconds() >= app.config['BACKUP_INTERVAL_HOURS'] * 3600
+
+class BackupScheduler:
+    def __init__(self, app):
+        self.app = app
+        self.thread = None
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+
+    def ensure_started(self):
+        if self.thread and self.thread.is_alive():
+            return
+        with self.lock:
+            if self.thread and self.thread.is_alive():
+                return
+            self.stopped.clear()
+            self.thread = threading.Thread(target=self.run, name='backup-scheduler', daemon=True)
+            self.thread.start()
+
+    def run(self):
+        while not self.stopped.wait(BACKUP_CHECK_SECONDS):
+            with self.app.app_context():
+                try:
+                    if backup_due():
+                        create_database_backup(only_if_due=True)
+                except BackupInProgress:
+                    pass
+                except Exception:
+                    self.app.logger.exception('Scheduled backup failed')
+
+    def stop(self):
+        self.stopped.set()
+
+backup_scheduler = BackupScheduler(app)
+atexit.register(backup_scheduler.stop)
+
+@app.cli.command('backup-db')
+def backup_db_command():
+    try:
+        path = create_database_backup()
+    except RuntimeError as e:
+        raise click.ClickException(str(e))
+    print(f"Backup written: {path} ({path.stat().st_size} bytes)")
+
 with app.app_context():
     db.create_all()
-    ensure_asset_schema()
+    ensure_audit_counter_schema()
+    if {'eol_date', 'routine_service_due_date'} & set(ensure_asset_schema()):
+        backfill_lifecycle_dates()
+    try:
+        if missing_indexes():
+            migrate_indexes()
+    except Exception:
+        db.session.rollback()
+    ensure_inventory_summary()
+    ensure_asset_search()
     bootstrap_it_admin()
+    if app.config['BACKUP_INTERVAL_HOURS'] > 0 and sqlite_database_path() is not None:
+        backup_scheduler.ensure_started()
 
 
 def generate_reset_token(user_id): 
@@ -1679,45 +4014,355 @@ def reset_password(token):
         user.password_hash = generate_password_hash(password)
         pr.used = True
         db.session.commit()
+        invalidate_user(user.id)
         log_action('password_reset_completed', 'User', user.id)
         flash('Password updated', 'success')
         return redirect(url_for('login'))
     return render_template('reset.html')
 
+AUDIT_ARCHIVE_MANIFEST = 'manifest.json'
+audit_archive_lock = threading.Lock()
+
+def audit_archive_dir():
+    return Path(app.config['AUDIT_ARCHIVE_FOLDER'])
+
+def load_audit_manifest():
+    path = audit_archive_dir() / AUDIT_ARCHIVE_MANIFEST
+    if not path.exists():
+        return {'version': 1, 'segments': []}
+    return json.loads(path.read_text())
+
+def save_audit_manifest(manifest):
+    folder = audit_archive_dir()
+    tmp_path = folder / (AUDIT_ARCHIVE_MANIFEST + '.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=1)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, folder / AUDIT_ARCHIVE_MANIFEST)
+
+def audit_log_record(row):
+    return {
+        'id': row.id,
+        'timestamp': row.timestamp.isoformat(),
+        'actor_user_id': row.actor_user_id,
+        'action': row.action,
+        'entity_type': row.entity_type,
+        'entity_id': row.entity_id,
+        'details': row.details,
+    }
+
+def read_audit_segment(segment):
+    with open(audit_archive_dir() / segment['file'], 'rb') as f:
+        f.seek(segment['offset'])
+        data = f.read(segment['length'])
+    if hashlib.sha256(data).hexdigest() != segment['sha256']:
+        raise ValueError(f"Archive segment {segment['file']}@{segment['offset']} failed checksum")
+    for line in gzip.decompress(data).decode('utf-8').splitlines():
+        record = json.loads(line)
+        record['timestamp'] = datetime.fromisoformat(record['timestamp'])
+        yield record
+
+def append_audit_segment(manifest, month, rows):
+    records = [audit_log_record(r) for r in rows]
+    data = gzip.compress(''.join(json.dumps(r) + '\n' for r in records).encode('utf-8'))
+    file_name = f'audit_{month}.jsonl.gz'
+    with open(audit_archive_dir() / file_name, 'ab') as f:
+        offset = f.tell()
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    segment = {
+        'month': month,
+        'file': file_name,
+        'offset': offset,
+        'length': len(data),
+        'sha256': hashlib.sha256(data).hexdigest(),
+        'rows': len(records),
+        'min_id': min(r['id'] for r in records),
+        'max_id': max(r['id'] for r in records),
+        'first_timestamp': min(r['timestamp'] for r in records),
+        'last_timestamp': max(r['timestamp'] for r in records),
+        'archived_at': datetime.utcnow().isoformat(),
+        'committed': False,
+    }
+    manifest['segments'].append(segment)
+    save_audit_manifest(manifest)
+    return segment
+
+def commit_audit_segment(manifest, segment):
+    ids = [r['id'] for r in read_audit_segment(segment)]
+    for i in range(0, len(ids), 500):
+        db.session.query(AuditLog).filter(AuditLog.id.in_(ids[i:i + 500])).delete(synchronize_session=False)
+    db.session.commit()
+    segment['committed'] = True
+    save_audit_manifest(manifest)
+
+def archive_audit_logs(retention_days=None):
+    if retention_days is None:
+        retention_days = app.config['AUDIT_RETENTION_DAYS']
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    batch_size = app.config['AUDIT_ARCHIVE_BATCH_SIZE']
+    archived = 0
+    with audit_archive_lock:
+        audit_archive_dir().mkdir(parents=True, exist_ok=True)
+        manifest = load_audit_manifest()
+        for segment in manifest['segments']:
+            if not segment['committed']:
+                commit_audit_segment(manifest, segment)
+        while True:
+            rows = (AuditLog.query.filter(AuditLog.timestamp < cutoff)
+                    .order_by(AuditLog.timestamp, AuditLog.id).limit(batch_size).all())
+            if not rows:
+                break
+            by_month = {}
+            for r in rows:
+                by_month.setdefault(r.timestamp.strftime('%Y-%m'), []).append(r)
+            for month, month_rows in by_month.items():
+                segment = append_audit_segment(manifest, month, month_rows)
+                commit_audit_segment(manifest, segment)
+                archived += segment['rows']
+    return archived, cutoff
+
+def iter_archived_audit_logs(start=None, end=None, action=None, actor_user_id=None, entity_type=None, entity_id=None, before=None, bad_segments=None):
+    segments = [
+        s for s in load_audit_manifest()['segments']
+        if s['committed']
+        and (start is None or s['last_timestamp'] >= start.isoformat())
+        and (end is None or s['first_timestamp'] < end.isoformat())
+        and (before is None or s['first_timestamp'] <= before[0].isoformat())
+    ]
+    months = sorted({s['month'] for s in segments}, reverse=True)
+    for month in months:
+        matches = []
+        for segment in segments:
+            if segment['month'] != month:
+                continue
+            try:
+                records = list(read_audit_segment(segment))
+            except (ValueError, OSError, EOFError, zlib.error):
+                # One damaged segment must not hide the rest of the archive
+                app.logger.exception('Skipping unreadable audit archive segment %s@%s', segment['file'], segment['offset'])
+                if bad_segments is not None:
+                    bad_segments.append(segment)
+                continue
+            for r in records:
+                if start and r['timestamp'] < start:
+                    continue
+                if end and r['timestamp'] >= end:
+                    continue
+                if action and r['action'] != action:
+                    continue
+                if actor_user_id is not None and r['actor_user_id'] != actor_user_id:
+                    continue
+                if entity_type and r['entity_type'] != entity_type:
+                    continue
+                if entity_id is not None and r['entity_id'] != entity_id:
+                    continue
+                if before and (r['timestamp'], r['id']) >= before:
+                    continue
+                matches.append(r)
+        matches.sort(key=lambda r: (r['timestamp'], r['id']), reverse=True)
+        yield from matches
+
+@app.cli.command('archive-audit')
+@click.option('--days', type=int, default=None, help='Archive entries older than this many days (default AUDIT_RETENTION_DAYS).')
+def archive_audit_command(days):
+    archived, cutoff = archive_audit_logs(days)
+    print(f"Archived {archived} audit log entries older than {cutoff:%Y-%m-%d %H:%M} to {audit_archive_dir()}")
+
+@app.cli.command('read-audit-archive')
+@click.option('--start', default=None, help='YYYY-MM-DD')
+@click.option('--end', default=None, help='YYYY-MM-DD (inclusive)')
+@click.option('--action', default=None)
+@click.option('--actor', type=int, default=None)
+def read_audit_archive_command(start, end, action, actor):
+    start_dt = datetime.strptime(start, '%Y-%m-%d') if start else None
+    end_dt = datetime.strptime(end, '%Y-%m-%d') + timedelta(days=1) if end else None
+    writer = csv.writer(sys.stdout)
+    writer.writerow(['id', 'timestamp', 'actor_user_id', 'action', 'entity_type', 'entity_id', 'details'])
+    bad_segments = []
+    for r in iter_archived_audit_logs(start_dt, end_dt, action, actor, bad_segments=bad_segments):
+        writer.writerow([r['id'], r['timestamp'].isoformat(), r['actor_user_id'], r['action'], r['entity_type'], r['entity_id'], r['details']])
+    for segment in bad_segments:
+        click.echo(f"Skipped unreadable segment {segment['file']}@{segment['offset']} ({segment['rows']} rows)", err=True)
+
+def format_audit_cursor(log):
+    return f"{log.timestamp.strftime('%Y%m%d%H%M%S%f')}-{log.id}"
+
+def parse_audit_cursor(value):
+    try:
+        ts, log_id = (value or '').split('-')
+        return datetime.strptime(ts, '%Y%m%d%H%M%S%f'), int(log_id)
+    except ValueError:
+        return None
+
+def audit_page(q, after=None, before=None, per_page=AUDIT_PAGE_SIZE):
+    if before:
+        ts, log_id = before
+        rows = (q.filter(AuditLog.timestamp >= ts, or_(AuditLog.timestamp > ts, AuditLog.id > log_id))
+                .order_by(AuditLog.timestamp, AuditLog.id).limit(per_page + 1).all())
+        has_prev = len(rows) > per_page
+        rows = list(reversed(rows[:per_page]))
+        has_next = True
+    else:
+        if after:
+            ts, log_id = after
+            q = q.filter(AuditLog.timestamp <= ts, or_(AuditLog.timestamp < ts, AuditLog.id < log_id))
+        rows = q.order_by(AuditLog.timestamp.desc(), AuditLog.id.desc()).limit(per_page + 1).all()
+        has_next = len(rows) > per_page
+        rows = rows[:per_page]
+        has_prev = bool(after)
+    return {
+        'rows': rows,
+        'next_cursor': format_audit_cursor(rows[-1]) if rows and has_next else None,
+        'prev_cursor': format_audit_cursor(rows[0]) if rows and has_prev else None,
+    }
+
+def audit_count_estimate(q):
+    if db.engine.name == 'postgresql':
+        try:
+            sql = str(q.statement.compile(dialect=db.engine.dialect, compile_kwargs={'literal_binds': True}))
+            plan = db.session.execute(text('EXPLAIN (FORMAT JSON) ' + sql)).scalar()
+            return int(plan[0]['Plan']['Plan Rows']), True, False
+        except Exception:
+            db.session.rollback()
+    counted = db.session.query(func.count()).select_from(q.with_entities(AuditLog.id).limit(AUDIT_COUNT_CAP + 1).subquery()).scalar()
+    capped = counted > AUDIT_COUNT_CAP
+    return min(counted, AUDIT_COUNT_CAP), capped, capped
+
 @app.route('/audit')
 @login_required
 def audit():
     if not can_view_audit_logs():
         flash('Access denied', 'danger')
         return redirect(url_for('index'))
-    action = request.args.get('action') or ''
-    actor = request.args.get('actor') or ''
-    q = AuditLog.query.order_by(AuditLog.timestamp.desc())
+    action = (request.args.get('action') or '').strip()
+    actor = (request.args.get('actor') or '').strip()
+    entity_type = (request.args.get('entity_type') or '').strip()
+    entity_id = (request.args.get('entity_id') or '').strip()
+    start_date_str = (request.args.get('start_date') or '').strip()
+    end_date_str = (request.args.get('end_date') or '').strip()
+    source = 'archive' if request.args.get('source') == 'archive' else 'live'
+    actor_id = entity_id_val = start_dt = end_dt = None
+    try:
+        actor_id = int(actor) if actor else None
+    except Exception:
+        pass
+    try:
+        entity_id_val = int(entity_id) if entity_type and entity_id else None
+    except Exception:
+        pass
+    try:
+        start_dt = datetime.strptime(start_date_str, '%Y-%m-%d') if start_date_str else None
+    except Exception:
+        pass
+    try:
+        end_dt = datetime.strptime(end_date_str, '%Y-%m-%d') + timedelta(days=1) if end_date_str else None
+    except Exception:
+        pass
+    filter_args = {k: v for k, v in request.args.items() if k not in ('after', 'before') and v}
+    after = parse_audit_cursor(request.args.get('after'))
+    if source == 'archive':
+        bad_segments = []
+        archived = iter_archived_audit_logs(start_dt, end_dt, action or None, actor_id, entity_type or None, entity_id_val, before=after, bad_segments=bad_segments)
+        rows = [SimpleNamespace(**r) for r in islice(archived, AUDIT_PAGE_SIZE + 1)]
+        for segment in bad_segments:
+            flash(f"Archive segment {segment['file']} at offset {segment['offset']} is damaged and was skipped ({segment['rows']} entries)", 'warning')
+        page = {
+            'rows': rows[:AUDIT_PAGE_SIZE],
+            'next_cursor': format_audit_cursor(rows[AUDIT_PAGE_SIZE - 1]) if len(rows) > AUDIT_PAGE_SIZE else None,
+            'prev_cursor': None,
+        }
+        page['next_url'] = url_for('audit', **filter_args, after=page['next_cursor']) if page['next_cursor'] else None
+        page['prev_url'] = url_for('audit', **filter_args) if after else None
+        total, approximate, capped = None, False, False
+    else:
+        q = AuditLog.query
+        if action:
+            q = q.filter(AuditLog.action == action)
+        if actor_id is not None:
+            q = q.filter(AuditLog.actor_user_id == actor_id)
+        if entity_type:
+            q = q.filter(AuditLog.entity_type == entity_type)
+            if entity_id_val is not None:
+                q = q.filter(AuditLog.entity_id == entity_id_val)
+        if start_dt:
+            q = q.filter(AuditLog.timestamp >= start_dt)
+        if end_dt:
+            q = q.filter(AuditLog.timestamp < end_dt)
+        page = audit_page(q, after=after, before=parse_audit_cursor(request.args.get('before')))
+        page['next_url'] = url_for('audit', **filter_args, after=page['next_cursor']) if page['next_cursor'] else None
+        page['prev_url'] = url_for('audit', **filter_args, before=page['prev_cursor']) if page['prev_cursor'] else None
+        total, approximate, capped = audit_count_estimate(q)
+    backup_files = []
+    if is_it():
+        try:
+            backup_files = list_backups()[:20]
+        except Exception:
+            backup_files = []
+    storage = None
+    if is_it():
+        try:
+            storage = storage_profile()
+        except Exception:
+            db.session.rollback()
+    return render_template('audit.html', logs=page['rows'], page=page, total=total, approximate=approximate, capped=capped, source=source, backup_files=backup_files, backup_dir=str(backup_dir()), backup_interval=app.config['BACKUP_INTERVAL_HOURS'], backup_retention=app.config['BACKUP_RETENTION_COUNT'], storage=storage)
+
+@app.route('/audit/views')
+@login_required
+def audit_views():
+    if not can_view_audit_logs():
+        flash('Access denied', 'danger')
+        return redirect(url_for('index'))
+    action = (request.args.get('action') or '').strip()
+    actor = (request.args.get('actor') or '').strip()
+    entity_type = (request.args.get('entity_type') or '').strip()
+    entity_id = (request.args.get('entity_id') or '').strip()
+    start_date_str = (request.args.get('start_date') or '').strip()
+    end_date_str = (request.args.get('end_date') or '').strip()
+    views = func.sum(AuditCounter.count).label('views')
+    q = db.session.query(
+        AuditCounter.actor_user_id,
+        AuditCounter.action,
+        AuditCounter.entity_type,
+        AuditCounter.entity_id,
+        AuditCounter.subject,
+        views,
+        func.min(AuditCounter.hour).label('first_hour'),
+        func.max(AuditCounter.last_seen).label('last_seen'),
+    )
     if action:
-        q = q.filter(AuditLog.action == action)
+        q = q.filter(AuditCounter.action == action)
     if actor:
         try:
-            actor_id = int(actor)
-            q = q.filter(AuditLog.actor_user_id == actor_id)
+            q = q.filter(AuditCounter.actor_user_id == int(actor))
         except Exception:
             pass
-    logs = q.all()
-    backup_dir = Path("D:/ICTAssetBackups")
-    backup_files = []
-    if is_it():
+    if entity_type:
+        q = q.filter(AuditCounter.entity_type == entity_type)
+        if entity_id:
+            try:
+                q = q.filter(AuditCounter.entity_id == int(entity_id))
+            except Exception:
+                pass
+    if start_date_str:
         try:
-            if backup_dir.exists():
-                files = sorted(backup_dir.glob("inventory_backup_*.db"), key=lambda p: p.stat().st_mtime, reverse=True)
-                for f in files[:20]:
-                    st = f.stat()
-                    backup_files.append({
-                        'name': f.name,
-                        'size': st.st_size,
-                        'mtime': datetime.fromtimestamp(st.st_mtime)
-                    })
+            q = q.filter(AuditCounter.hour >= datetime.strptime(start_date_str, '%Y-%m-%d'))
         except Exception:
-            backup_files = []
-    return render_template('audit.html', logs=logs, backup_files=backup_files, backup_dir=str(backup_dir))
+            pass
+    if end_date_str:
+        try:
+            q = q.filter(AuditCounter.hour < datetime.strptime(end_date_str, '%Y-%m-%d') + timedelta(days=1))
+        except Exception:
+            pass
+    rows = (q.group_by(AuditCounter.actor_user_id, AuditCounter.action, AuditCounter.entity_type, AuditCounter.entity_id, AuditCounter.subject)
+            .order_by(views.desc()).limit(500).all())
+    user_ids = {r.actor_user_id for r in rows if r.actor_user_id}
+    asset_ids = {r.entity_id for r in rows if r.entity_type == 'Asset' and r.entity_id}
+    usernames = dict(db.session.query(User.id, User.username).filter(User.id.in_(user_ids)).all()) if user_ids else {}
+    asset_names = dict(db.session.query(Asset.id, Asset.name).filter(Asset.id.in_(asset_ids)).all()) if asset_ids else {}
+    return render_template('audit_views.html', rows=rows, usernames=usernames, asset_names=asset_names, rollup_actions=sorted(app.config['AUDIT_ROLLUP_ACTIONS']), rollup_seconds=int(app.config['AUDIT_ROLLUP_FLUSH_SECONDS']))
 
 @app.route('/backup/download')
 @login_required
@@ -1725,19 +4370,56 @@ def download_backup():
     if not is_it():
         flash('Access denied', 'danger')
         return redirect(url_for('index'))
-    db_path = Path(app.instance_path) / 'inventory.db'
-    if not db_path.exists():
-        flash('Database file not found for backup', 'danger')
+    if sqlite_database_path() is None:
+        return redirect(url_for('download_logical_dump'))
+    # On-demand snapshots go to a temp file that is deleted after streaming, so they
+    # never count against BACKUP_RETENTION_COUNT and push out scheduled backups
+    name = backup_file_name()
+    tmp_dir = tempfile.mkdtemp(prefix='inventory_backup_')
+    try:
+        path = write_database_snapshot(database_backup_source(), Path(tmp_dir) / 'snapshot.db.gz', name)
+    except (RuntimeError, sqlite3.Error) as e:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        flash(str(e), 'danger')
         return redirect(url_for('audit'))
-    ts = datetime.now().strftime('%Y%m%d_%H%M%S')
-    filename = f"inventory_backup_{ts}.db"
-    return send_from_directory(
-        directory=str(db_path.parent),
-        path=db_path.name,
-        as_attachment=True,
-        download_name=filename
+    size = path.stat().st_size
+    log_action('download_backup', details=name)
+
+    def stream():
+        try:
+            yield from iter_file_chunks(path)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    return Response(stream(), mimetype='application/gzip', headers={
+        'Content-Disposition': f'attachment; filename="{name}"',
+        'Content-Length': str(size),
+    })
+
+@app.route('/backup/logical')
+@login_required
+def download_logical_dump():
+    if not is_it():
+        flash('Access denied', 'danger')
+        return redirect(url_for('index'))
+    filename = f"inventory_dump_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl.gz"
+    log_action('download_logical_dump', details=filename)
+    return Response(
+        stream_with_context(iter_gzip(iter_logical_dump())),
+        mimetype='application/gzip',
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
     )
 
+@app.route('/backup/files/<name>')
+@login_required
+def download_backup_file(name):
+    if not is_it():
+        flash('Access denied', 'danger')
+        return redirect(url_for('index'))
+    if name not in {b['name'] for b in list_backups()}:
+        abort(404)
+    log_action('download_backup', details=name)
+    return send_from_directory(directory=str(backup_dir()), path=name, as_attachment=True)
+
 @app.route('/users/<int:id>/edit', methods=['GET', 'POST'])
 @login_required
 def edit_user(id):
@@ -1795,6 +4477,7 @@ def edit_user(id):
                 return redirect(url_for('edit_user', id=id))
             user.password_hash = generate_password_hash(password)
         db.session.commit()
+        invalidate_user(user.id)
         log_action('update_user', 'User', user.id, user.username)
         flash('User updated', 'success')
         return redirect(url_for('users'))
@@ -1812,6 +4495,7 @@ def toggle_user_active(id):
         return redirect(url_for('users'))
     user.active = not user.active
     db.session.commit()
+    invalidate_user(user.id)
     log_action('toggle_user_active', 'User', user.id, user.username)
     flash('User state updated', 'success')
     return redirect(url_for('users'))
@@ -1836,6 +4520,7 @@ def delete_user(id):
         return redirect(url_for('users'))
     db.session.delete(user)
     db.session.commit()
+    invalidate_user(user.id)
     log_action('delete_user', 'User', user.id, user.username)
     flash('User deleted', 'success')
     return redirect(url_for('users'))
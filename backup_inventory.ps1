@@ -1,14 +1,18 @@
-$SourceDb = "C:\Users\User\OneDrive\Desktop\New folder\instance\inventory.db"
-$BackupRoot = "D:\ICTAssetBackups"
-if (!(Test-Path -Path $BackupRoot)) {
-    New-Item -ItemType Directory -Path $BackupRoot | Out-Null
-}
-$timestamp = Get-Date -Format "yyyyMMdd_HHmmss"
-$BackupFile = Join-Path $BackupRoot ("inventory_backup_{0}.db" -f $timestamp)
-Copy-Item -Path $SourceDb -Destination $BackupFile -Force
-$maxBackups = 30
-Get-ChildItem -Path $BackupRoot -Filter "inventory_backup_*.db" |
-    Sort-Object LastWriteTime -Descending |
-    Select-Object -Skip $maxBackups |
-    Remove-Item -Force
+Param(
+  [string]$BackupFolder
+)
 
+# Takes one online backup through the app, so the snapshot is consistent in WAL mode
+# and retention follows BACKUP_RETENTION_COUNT. Pass -BackupFolder D:\ICTAssetBackups
+# (or set BACKUP_FOLDER) to keep writing to the folder the old copy script used.
+$cwd = Split-Path -Parent $MyInvocation.MyCommand.Path
+if ($BackupFolder) {
+  $env:BACKUP_FOLDER = $BackupFolder
+}
+Push-Location $cwd
+try {
+  python -m flask --app app backup-db
+  if ($LASTEXITCODE -ne 0) { exit $LASTEXITCODE }
+} finally {
+  Pop-Location
+}
@@ -1,4 +1,5 @@
 import sqlite3
+from datetime import datetime
 
 conn = sqlite3.connect("instance/inventory.db")
 cursor = conn.cursor()
@@ -10,10 +11,24 @@ tables_to_clear = [
     "password_reset_token"
 ]
 
-for table in tables_to_clear:
-    cursor.execute(f"DELETE FROM {table}")
+# Tables derived from the ones above; left alone they keep counting deleted rows
+derived_tables = [
+    "inventory_summary",
+    "audit_counter",
+    "asset_search",
+]
+
+existing = {row[0] for row in cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
 
+for table in tables_to_clear + derived_tables:
+    if table in existing:
+        cursor.execute(f"DELETE FROM {table}")
 
+# Invalidate cached reports and dashboard validators in running workers
+if "data_version" in existing:
+    now = datetime.utcnow().isoformat(sep=" ")
+    cursor.execute("UPDATE data_version SET version = version + 1, updated_at = ?", (now,))
+    cursor.execute("INSERT OR IGNORE INTO data_version (scope, version, updated_at) VALUES ('', 1, ?)", (now,))
 
 conn.commit()
 conn.close()